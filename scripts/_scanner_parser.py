@@ -0,0 +1,79 @@
+"""
+Scanner Log Parser
+Hot loop behind analyze_eod.parse_scanner_log, kept in its own module so it
+stays plain Python: it runs unchanged under PyPy and can be compiled with
+`cythonize -i scripts/_scanner_parser.py` for very large logs.
+"""
+
+import functools
+import re
+import sys
+from datetime import datetime
+
+# Scanner log line (score= is optional):
+#   Top 5 logs:      2025-10-08 15:36:22,193 [INFO]    SNAP: score=149.9 chg=+2.4% last=8.38 open=8.18 vol=104.9M [active_30min_window]
+#   Group Watchlist: 2025-10-08 15:36:21,707 [INFO]    UPC: chg=+3.9% last=8.08 open=7.78 vol=22.3M
+# Matched against raw bytes; float()/int() accept bytes directly.
+# Groups: 1=timestamp 2=ticker 3=score 4=chg 5=last 6=open 7=vol 8=vol unit
+LINE_RE = re.compile(
+    rb'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}).*?'
+    rb'(\w+):\s+(?:score=([\d.]+)\s+)?chg=([+-]?[\d.]+)%\s+last=([\d.]+)\s+(?:open=([\d.]+)\s+)?vol=([\d.]+)([KM])?'
+)
+
+# Log timestamps are naive ET; epoch seconds here treat them as UTC so they
+# round-trip through analyze_eod._to_time without any local-timezone shifts.
+EPOCH = datetime(1970, 1, 1)
+
+
+@functools.lru_cache(maxsize=8192)
+def parse_ts(ts: bytes) -> int:
+    """Parse 'YYYY-MM-DD HH:MM:SS' to epoch seconds (many log lines share the same second)"""
+    dt = datetime(int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                  int(ts[11:13]), int(ts[14:16]), int(ts[17:19]))
+    return int((dt - EPOCH).total_seconds())
+
+
+def parse_log(log_path: str, new_trajectory) -> dict:
+    """
+    Parse a scanner log into {ticker: trajectory}.
+    new_trajectory(ticker) builds a trajectory object exposing open_price and
+    add_appearance(ts, price, change_pct, volume, score).
+    """
+    trajectories = {}
+    # Same trajectories keyed by the raw ticker bytes, so a line only pays
+    # for decoding (and interning) the ticker the first time it is seen
+    by_raw = {}
+    by_raw_get = by_raw.get
+
+    # Binary mode skips decoding every line
+    with open(log_path, 'rb', buffering=1 << 20) as f:
+        for line in f:
+            # Cheap substring checks before touching the regex engine
+            # (skips DEBUG/WARNING lines, tracebacks and blank lines)
+            if b"chg=" not in line or b"[INFO]" not in line:
+                continue
+
+            match = LINE_RE.match(line)
+            if not match:
+                continue
+
+            timestamp = match.group(1)
+            score = float(match.group(3)) if match.group(3) else 0.0
+            change_pct = float(match.group(4))
+            price = float(match.group(5))
+            volume_num = float(match.group(7))
+            volume_unit = match.group(8)
+
+            volume = volume_num * 1_000_000 if volume_unit == b"M" else volume_num * 1_000
+
+            raw_ticker = match.group(2)
+            traj = by_raw_get(raw_ticker)
+            if traj is None:
+                ticker = sys.intern(raw_ticker.decode('ascii'))
+                traj = trajectories[ticker] = by_raw[raw_ticker] = new_trajectory(ticker)
+            # Open price comes from the first line that carries one
+            if traj.open_price is None and match.group(6):
+                traj.open_price = float(match.group(6)) or None
+            traj.add_appearance(parse_ts(timestamp[:19]), price, change_pct, volume, score)
+
+    return trajectories
@@ -9,89 +9,121 @@ Outputs a daily report with:
 """
 
 import os
-import re
 import csv
-from datetime import datetime, date
-from collections import defaultdict
+import heapq
+from array import array
+from datetime import datetime, date, timedelta
 from typing import List, Dict, Tuple, Optional
 
+import numpy as np
+
+from _scanner_parser import EPOCH, parse_log
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; score_and_filter falls back to NumPy masks
+    njit = None
+
 # Paths
 LOG_DIR = "logs"
 OUTPUT_DIR = "output"
 MISSED_CSV = os.path.join(OUTPUT_DIR, "missed.csv")
 JOURNAL_CSV = os.path.join(OUTPUT_DIR, "journal.csv")
 
+# journal.csv columns (see src/core/journal.py JOURNAL_HEADERS); loaded trades
+# are lists in this order, indexed by the J_* positions below
+J_FIELDS = (
+    'date', 'ticker', 'side', 'entry_price', 'exit_price', 'shares',
+    'total_cost', 'pl_dollar', 'pl_percent', 'plan', 'actual', 'notes'
+)
+J_DATE, J_TICKER, J_SIDE, J_ENTRY, J_EXIT, J_SHARES = 0, 1, 2, 3, 4, 5
+J_TOTAL_COST, J_PL_DOLLAR, J_PL_PERCENT, J_PLAN, J_ACTUAL, J_NOTES = 6, 7, 8, 9, 10, 11
+
+MISSED_FIELDS = (
+    'date', 'ticker', 'open_price', 'first_seen_time', 'first_seen_price',
+    'peak_time', 'peak_price', 'gain_pct', 'volume_m',
+    'entry_window', 'exit_window', 'notes'
+)
+
 # Thresholds
 MIN_GAIN_PCT = 8.0  # Minimum gain % to be considered
 MIN_VOLUME = 1_000_000  # Minimum volume to avoid illiquid stocks
 
+# Entry/exit windows
+ENTRY_APPEARANCES = 10  # Entry window looks at the first N appearances
+EXIT_PEAK_RATIO = 0.98  # Exit window covers appearances within 2% of peak
 
-class StockAppearance:
-    """Represents a single appearance of a stock in the scanner log"""
-    def __init__(self, ticker: str, timestamp: str, price: float, change_pct: float,
-                 volume: float, score: float):
-        self.ticker = ticker
-        self.timestamp = timestamp
-        self.time = self._parse_time(timestamp)
-        self.price = price
-        self.change_pct = change_pct
-        self.volume = volume
-        self.score = score
-
-    def _parse_time(self, timestamp: str) -> datetime:
-        """Parse timestamp from log line"""
-        # Format: 2025-10-08 15:36:22,193
-        try:
-            return datetime.strptime(timestamp[:19], "%Y-%m-%d %H:%M:%S")
-        except:
-            return datetime.now()
+
+def _to_time(epoch: int) -> datetime:
+    return EPOCH + timedelta(seconds=int(epoch))
 
 
 class StockTrajectory:
     """Tracks the full trajectory of a stock throughout the day"""
     def __init__(self, ticker: str):
         self.ticker = ticker
-        self.appearances: List[StockAppearance] = []
+        # Only the appearances the entry/exit windows need are retained:
+        # the first ENTRY_APPEARANCES, and those within 2% of the running peak
+        self.early_ts = array('q')      # epoch seconds
+        self.early_price = array('d')
+        # (price, seq, ts) min-heap: a new peak pops just the entries that fell
+        # below its floor, so each appearance is pruned at most once
+        self.near_peak: List[Tuple[float, int, int]] = []
+        self.appearances = 0
         self.first_price: Optional[float] = None
-        self.first_time: Optional[datetime] = None
+        self.first_ts: Optional[int] = None
         self.peak_price: float = 0.0
-        self.peak_time: Optional[datetime] = None
+        self.peak_ts: Optional[int] = None
         self.last_price: Optional[float] = None
-        self.last_time: Optional[datetime] = None
+        self.last_ts: Optional[int] = None
         self.max_volume: float = 0.0
         self.open_price: Optional[float] = None
+        self.gain: Optional[float] = None  # open-to-peak %, set by identify_best_picks
 
-    def add_appearance(self, appearance: StockAppearance):
-        """Add a new appearance to the trajectory"""
-        self.appearances.append(appearance)
+    @property
+    def first_time(self) -> Optional[datetime]:
+        return _to_time(self.first_ts) if self.first_ts is not None else None
+
+    @property
+    def peak_time(self) -> Optional[datetime]:
+        return _to_time(self.peak_ts) if self.peak_ts is not None else None
+
+    @property
+    def last_time(self) -> Optional[datetime]:
+        return _to_time(self.last_ts) if self.last_ts is not None else None
 
+    def add_appearance(self, ts: int, price: float, change_pct: float, volume: float,
+                       score: float):
+        """Add a new appearance to the trajectory"""
         # Track first appearance
         if self.first_price is None:
-            self.first_price = appearance.price
-            self.first_time = appearance.time
-
-        # Track peak
-        if appearance.price > self.peak_price:
-            self.peak_price = appearance.price
-            self.peak_time = appearance.time
+            self.first_price = price
+            self.first_ts = ts
+
+        if len(self.early_ts) < ENTRY_APPEARANCES:
+            self.early_ts.append(ts)
+            self.early_price.append(price)
+
+        # Track peak; a higher peak can push older near-peak appearances out
+        near_peak = self.near_peak
+        if price > self.peak_price:
+            self.peak_price = price
+            self.peak_ts = ts
+            floor = price * EXIT_PEAK_RATIO
+            while near_peak and near_peak[0][0] < floor:
+                heapq.heappop(near_peak)
+
+        if price >= self.peak_price * EXIT_PEAK_RATIO:
+            heapq.heappush(near_peak, (price, self.appearances, ts))
+        self.appearances += 1
 
         # Track last
-        self.last_price = appearance.price
-        self.last_time = appearance.time
+        self.last_price = price
+        self.last_ts = ts
 
         # Track max volume
-        if appearance.volume > self.max_volume:
-            self.max_volume = appearance.volume
-
-    def extract_open_price(self):
-        """Try to extract the open price from appearances"""
-        # Look for the first appearance that mentions an open price
-        for app in self.appearances:
-            if hasattr(app, 'open_price') and app.open_price:
-                self.open_price = app.open_price
-                return
-        # Fallback: use first price as open
-        self.open_price = self.first_price
+        if volume > self.max_volume:
+            self.max_volume = volume
 
     def calculate_gain(self) -> float:
         """Calculate % gain from first appearance to peak"""
@@ -123,140 +155,124 @@ class StockTrajectory:
 
         return True
 
+    @staticmethod
+    def _window(ts: array, prices: array, mask: np.ndarray) -> Optional[Tuple[str, str, float, float]]:
+        """Time and price range of the appearances selected by mask"""
+        idx = np.flatnonzero(mask)
+        if not idx.size:
+            return None
+        selected = np.asarray(prices)[idx]
+        start_time = _to_time(ts[idx[0]]).strftime("%H:%M")
+        end_time = _to_time(ts[idx[-1]]).strftime("%H:%M")
+        return (start_time, end_time, float(selected.min()), float(selected.max()))
+
     def get_entry_window(self) -> Tuple[str, str, float, float]:
         """Get optimal entry window (time range and price range)"""
-        if not self.first_time:
+        if self.first_ts is None:
             return ("N/A", "N/A", 0.0, 0.0)
 
         # Entry window: first 10 appearances or first 30 minutes
-        entry_apps = []
-        cutoff_time = self.first_time.timestamp() + (30 * 60)  # 30 min
-
-        for app in self.appearances[:10]:
-            if app.time.timestamp() <= cutoff_time:
-                entry_apps.append(app)
-
-        if not entry_apps:
-            entry_apps = [self.appearances[0]]
-
-        start_time = entry_apps[0].time.strftime("%H:%M")
-        end_time = entry_apps[-1].time.strftime("%H:%M")
-        min_price = min(app.price for app in entry_apps)
-        max_price = max(app.price for app in entry_apps)
-
-        return (start_time, end_time, min_price, max_price)
+        mask = np.asarray(self.early_ts) <= self.first_ts + (30 * 60)  # 30 min
+        return self._window(self.early_ts, self.early_price, mask)
 
     def get_exit_window(self) -> Tuple[str, str, float, float]:
         """Get optimal exit window (near peak)"""
-        if not self.peak_time or not self.peak_price:
+        if self.peak_ts is None or not self.peak_price:
             return ("N/A", "N/A", 0.0, 0.0)
 
-        # Exit window: +/- 2% of peak price
-        peak_threshold = self.peak_price * 0.98
-        exit_apps = [app for app in self.appearances if app.price >= peak_threshold]
-
-        if not exit_apps:
-            return (self.peak_time.strftime("%H:%M"), self.peak_time.strftime("%H:%M"),
-                    self.peak_price, self.peak_price)
-
-        start_time = exit_apps[0].time.strftime("%H:%M")
-        end_time = exit_apps[-1].time.strftime("%H:%M")
-        min_price = min(app.price for app in exit_apps)
-        max_price = max(app.price for app in exit_apps)
-
-        return (start_time, end_time, min_price, max_price)
+        # Exit window: +/- 2% of peak price, in log order
+        near_peak = sorted(self.near_peak, key=lambda e: e[1])
+        prices = np.array([e[0] for e in near_peak], dtype=np.float64)
+        ts = array('q', [e[2] for e in near_peak])
+        window = self._window(ts, prices, prices >= self.peak_price * EXIT_PEAK_RATIO)
+        if window is None:
+            peak_time = self.peak_time.strftime("%H:%M")
+            return (peak_time, peak_time, self.peak_price, self.peak_price)
+        return window
 
 
 def parse_scanner_log(log_path: str) -> Dict[str, StockTrajectory]:
     """Parse scanner log and extract stock trajectories"""
-    trajectories = defaultdict(lambda: StockTrajectory(""))
-
-    # Regex patterns for different log formats
-    # Pattern 1: Top 5 logs with scores
-    # Example: 2025-10-08 15:36:22,193 [INFO]    SNAP: score=149.9 chg=+2.4% last=8.38 open=8.18 vol=104.9M [active_30min_window]
-    pattern1 = re.compile(
-        r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}).*?'
-        r'(\w+):\s+score=([\d.]+)\s+chg=([+-]?[\d.]+)%\s+last=([\d.]+)\s+(?:open=([\d.]+)\s+)?vol=([\d.]+)([KM])?'
-    )
-
-    # Pattern 2: Group Watchlist logs
-    # Example: 2025-10-08 15:36:21,707 [INFO]    UPC: chg=+3.9% last=8.08 open=7.78 vol=22.3M
-    pattern2 = re.compile(
-        r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}).*?'
-        r'(\w+):\s+chg=([+-]?[\d.]+)%\s+last=([\d.]+)\s+(?:open=([\d.]+)\s+)?vol=([\d.]+)([KM])?'
-    )
-
-    with open(log_path, 'r') as f:
-        for line in f:
-            # Try pattern 1 (with score)
-            match = pattern1.search(line)
-            if match:
-                timestamp = match.group(1)
-                ticker = match.group(2)
-                score = float(match.group(3))
-                change_pct = float(match.group(4))
-                price = float(match.group(5))
-                open_price = float(match.group(6)) if match.group(6) else None
-                volume_num = float(match.group(7))
-                volume_unit = match.group(8) if match.group(8) else ""
-
-                volume = volume_num * 1_000_000 if volume_unit == "M" else volume_num * 1_000
-
-                appearance = StockAppearance(ticker, timestamp, price, change_pct, volume, score)
-                if open_price:
-                    appearance.open_price = open_price
-
-                if ticker not in trajectories:
-                    trajectories[ticker] = StockTrajectory(ticker)
-                trajectories[ticker].add_appearance(appearance)
-                continue
-
-            # Try pattern 2 (without score)
-            match = pattern2.search(line)
-            if match:
-                timestamp = match.group(1)
-                ticker = match.group(2)
-                change_pct = float(match.group(3))
-                price = float(match.group(4))
-                open_price = float(match.group(5)) if match.group(5) else None
-                volume_num = float(match.group(6))
-                volume_unit = match.group(7) if match.group(7) else ""
+    trajectories = parse_log(log_path, StockTrajectory)
 
-                volume = volume_num * 1_000_000 if volume_unit == "M" else volume_num * 1_000
-
-                appearance = StockAppearance(ticker, timestamp, price, change_pct, volume, 0.0)
-                if open_price:
-                    appearance.open_price = open_price
-
-                if ticker not in trajectories:
-                    trajectories[ticker] = StockTrajectory(ticker)
-                trajectories[ticker].add_appearance(appearance)
-
-    # Extract open prices
+    # Tickers never logged with open= fall back to their first price
     for traj in trajectories.values():
-        traj.extract_open_price()
+        if traj.open_price is None:
+            traj.open_price = traj.first_price
 
     return trajectories
 
 
-def identify_best_picks(trajectories: Dict[str, StockTrajectory]) -> List[StockTrajectory]:
+def _score_and_filter_loop(open_p, peak_p, max_vol, first_epoch, peak_epoch, min_gain, min_volume):
+    """Open-to-peak gain and catchable keep-mask for a table of trajectories (numba kernel)"""
+    n = open_p.shape[0]
+    gains = np.zeros(n)
+    keep = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        if open_p[i] == 0.0:
+            continue
+        gains[i] = (peak_p[i] - open_p[i]) / open_p[i] * 100.0
+        # Must have appeared before 2 PM, with volume, and a peak >= 5 min later
+        keep[i] = (gains[i] >= min_gain
+                   and (first_epoch[i] // 3600) % 24 < 14
+                   and max_vol[i] >= min_volume
+                   and peak_epoch[i] - first_epoch[i] >= 5 * 60)
+    return gains, keep
+
+
+def _score_and_filter_numpy(open_p, peak_p, max_vol, first_epoch, peak_epoch, min_gain, min_volume):
+    """Same gains and keep-mask as the numba kernel, as whole-array NumPy ops"""
+    has_open = open_p != 0.0
+    gains = np.zeros(open_p.shape[0])
+    np.divide(peak_p - open_p, open_p, out=gains, where=has_open)
+    gains *= 100.0
+    keep = (has_open
+            & (gains >= min_gain)
+            & ((first_epoch // 3600) % 24 < 14)
+            & (max_vol >= min_volume)
+            & (peak_epoch - first_epoch >= 5 * 60))
+    return gains, keep
+
+
+score_and_filter = njit(cache=True)(_score_and_filter_loop) if njit is not None else _score_and_filter_numpy
+
+
+def identify_best_picks(trajectories: Dict[str, StockTrajectory],
+                        min_gain: float = MIN_GAIN_PCT) -> List[StockTrajectory]:
     """Identify the best catchable picks from trajectories"""
-    candidates = []
+    trajs = list(trajectories.values())
+    n = len(trajs)
 
-    for traj in trajectories.values():
-        gain = traj.calculate_open_to_peak_gain()
+    # One column per field across all trajectories
+    open_p = np.fromiter((t.open_price or t.first_price or 0.0 for t in trajs), np.float64, n)
+    peak_p = np.fromiter((t.peak_price for t in trajs), np.float64, n)
+    max_vol = np.fromiter((t.max_volume for t in trajs), np.float64, n)
+    first_epoch = np.fromiter((t.first_ts for t in trajs), np.int64, n)
+    peak_epoch = np.fromiter((t.first_ts if t.peak_ts is None else t.peak_ts for t in trajs), np.int64, n)
 
-        # Filter criteria
-        if gain >= MIN_GAIN_PCT and traj.is_catchable():
-            candidates.append(traj)
+    gains, keep = score_and_filter(open_p, peak_p, max_vol, first_epoch, peak_epoch,
+                                   min_gain, float(MIN_VOLUME))
 
-    # Sort by gain (descending)
-    candidates.sort(key=lambda t: t.calculate_open_to_peak_gain(), reverse=True)
+    # Sort by gain (descending), ties keep log order
+    idx = np.flatnonzero(keep)
+    order = idx[np.argsort(-gains[idx], kind="stable")]
+    best_picks = [trajs[i] for i in order]
+    for traj, gain in zip(best_picks, gains[order].tolist()):
+        traj.gain = gain
+    return best_picks
 
-    return candidates
 
+# (trajectory, open-to-peak gain %, entry window, exit window) for each top pick
+PickData = Tuple[StockTrajectory, float, Tuple[str, str, float, float], Tuple[str, str, float, float]]
 
-def write_daily_report(report_date: date, best_picks: List[StockTrajectory]):
+
+def build_pick_data(best_picks: List[StockTrajectory], top_n: int = 5) -> List[PickData]:
+    """Compute gain and entry/exit windows once for the top picks"""
+    return [(traj, traj.gain, traj.get_entry_window(), traj.get_exit_window())
+            for traj in best_picks[:top_n]]
+
+
+def write_daily_report(report_date: date, pick_data: List[PickData]):
     """Write daily EOD report to console and markdown file"""
     # Create reports subdirectory if it doesn't exist
     reports_dir = os.path.join(OUTPUT_DIR, "reports")
@@ -271,17 +287,16 @@ def write_daily_report(report_date: date, best_picks: List[StockTrajectory]):
     lines.append(f"**Minimum Gain Threshold:** {MIN_GAIN_PCT}%")
     lines.append("")
 
-    if not best_picks:
+    if not pick_data:
         lines.append("**No catchable opportunities found today** (min gain: {}%)".format(MIN_GAIN_PCT))
         print("No catchable opportunities found today.")
     else:
-        lines.append(f"## Top {min(len(best_picks), 5)} Catchable Picks")
+        lines.append(f"## Top {len(pick_data)} Catchable Picks")
         lines.append("")
 
-        for i, traj in enumerate(best_picks[:5], 1):
-            gain = traj.calculate_open_to_peak_gain()
-            entry_start, entry_end, entry_min, entry_max = traj.get_entry_window()
-            exit_start, exit_end, exit_min, exit_max = traj.get_exit_window()
+        for i, (traj, gain, entry_window, exit_window) in enumerate(pick_data, 1):
+            entry_start, entry_end, entry_min, entry_max = entry_window
+            exit_start, exit_end, exit_min, exit_max = exit_window
 
             lines.append(f"### #{i}: {traj.ticker} (+{gain:.1f}%)")
             lines.append("")
@@ -315,9 +330,13 @@ def write_daily_report(report_date: date, best_picks: List[StockTrajectory]):
     print(f"Report saved: {report_path}")
 
 
-def append_to_missed_csv(report_date: date, best_picks: List[StockTrajectory]):
+# (start, end, min price, max price) -> "09:45-10:05 @ $1.23-$1.45"
+_WINDOW_FMT = "%s-%s @ $%.2f-$%.2f"
+
+
+def append_to_missed_csv(report_date: date, pick_data: List[PickData]):
     """Append missed opportunities to missed.csv"""
-    if not best_picks:
+    if not pick_data:
         return
 
     # Ensure output directory exists
@@ -327,40 +346,32 @@ def append_to_missed_csv(report_date: date, best_picks: List[StockTrajectory]):
     file_exists = os.path.isfile(MISSED_CSV)
 
     with open(MISSED_CSV, 'a', newline='') as f:
-        fieldnames = [
-            'date', 'ticker', 'open_price', 'first_seen_time', 'first_seen_price',
-            'peak_time', 'peak_price', 'gain_pct', 'volume_m',
-            'entry_window', 'exit_window', 'notes'
-        ]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.writer(f)
 
         if not file_exists:
-            writer.writeheader()
-
-        for traj in best_picks[:5]:  # Top 5 only
-            gain = traj.calculate_open_to_peak_gain()
-            entry_start, entry_end, entry_min, entry_max = traj.get_entry_window()
-            exit_start, exit_end, exit_min, exit_max = traj.get_exit_window()
-
-            writer.writerow({
-                'date': report_date.strftime('%Y-%m-%d'),
-                'ticker': traj.ticker,
-                'open_price': f"{traj.open_price:.2f}" if traj.open_price else "",
-                'first_seen_time': traj.first_time.strftime('%H:%M') if traj.first_time else "",
-                'first_seen_price': f"{traj.first_price:.2f}" if traj.first_price else "",
-                'peak_time': traj.peak_time.strftime('%H:%M') if traj.peak_time else "",
-                'peak_price': f"{traj.peak_price:.2f}",
-                'gain_pct': f"{gain:.1f}",
-                'volume_m': f"{traj.max_volume / 1_000_000:.1f}",
-                'entry_window': f"{entry_start}-{entry_end} @ ${entry_min:.2f}-${entry_max:.2f}",
-                'exit_window': f"{exit_start}-{exit_end} @ ${exit_min:.2f}-${exit_max:.2f}",
-                'notes': f"EOD Analysis - Best pick #{best_picks.index(traj) + 1}"
-            })
-
-    print(f"Appended {len(best_picks[:5])} missed opportunities to {MISSED_CSV}")
-
-
-def load_journal_trades(report_date: date) -> List[Dict]:
+            writer.writerow(MISSED_FIELDS)
+
+        date_str = report_date.strftime('%Y-%m-%d')
+        for rank, (traj, gain, entry_window, exit_window) in enumerate(pick_data, 1):
+            writer.writerow((
+                date_str,
+                traj.ticker,
+                "%.2f" % traj.open_price if traj.open_price else "",
+                traj.first_time.strftime('%H:%M') if traj.first_time else "",
+                "%.2f" % traj.first_price if traj.first_price else "",
+                traj.peak_time.strftime('%H:%M') if traj.peak_time else "",
+                "%.2f" % traj.peak_price,
+                "%.1f" % gain,
+                "%.1f" % (traj.max_volume / 1_000_000),
+                _WINDOW_FMT % entry_window,
+                _WINDOW_FMT % exit_window,
+                "EOD Analysis - Best pick #%d" % rank
+            ))
+
+    print(f"Appended {len(pick_data)} missed opportunities to {MISSED_CSV}")
+
+
+def load_journal_trades(report_date: date) -> List[List[str]]:
     """Load trades from journal.csv for the given date"""
     trades = []
 
@@ -368,19 +379,30 @@ def load_journal_trades(report_date: date) -> List[Dict]:
         return trades
 
     with open(JOURNAL_CSV, 'r', newline='') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return trades
+
+        # File column of each J_FIELDS entry, resolved once from the header
+        # (-1 = column absent; absent and short-row cells read as '')
+        position = {name: i for i, name in enumerate(header)}
+        cols = [position.get(name, -1) for name in J_FIELDS]
+
         for row in reader:
+            width = len(row)
+            trade = [row[i] if 0 <= i < width else '' for i in cols]
             try:
-                trade_date = datetime.strptime(row['date'], '%Y-%m-%d').date()
-                if trade_date == report_date:
-                    trades.append(row)
-            except:
+                trade_date = date.fromisoformat(trade[J_DATE])
+            except ValueError:
                 continue
+            if trade_date == report_date:
+                trades.append(trade)
 
     return trades
 
 
-def compare_with_journal(report_date: date, best_picks: List[StockTrajectory], trades: List[Dict]):
+def compare_with_journal(report_date: date, pick_data: List[PickData], trades: List[List[str]]):
     """Compare EOD best picks with actual journal trades"""
     if not trades:
         print("\n📝 No trades logged in journal for today")
@@ -391,16 +413,17 @@ def compare_with_journal(report_date: date, best_picks: List[StockTrajectory], t
     print(f"📊 TRADING PERFORMANCE vs BEST PICKS ({report_date})")
     print("="*60)
 
-    # Get best pick tickers
-    best_tickers = {traj.ticker for traj in best_picks[:5]}
+    # Get best pick tickers and their EOD rank
+    rank_by_ticker = {pick[0].ticker: (rank, pick) for rank, pick in enumerate(pick_data, 1)}
+    best_tickers = rank_by_ticker.keys()
 
     for i, trade in enumerate(trades, 1):
-        ticker = trade['ticker'].upper()
-        entry = float(trade['entry_price']) if trade['entry_price'] else 0
-        exit_price = float(trade['exit_price']) if trade['exit_price'] and trade['exit_price'] != '' else None
-        shares = int(trade['shares']) if trade['shares'] else 0
-        pl_pct = float(trade['pl_percent']) if trade['pl_percent'] else 0
-        pl_dollar = float(trade['pl_dollar']) if trade['pl_dollar'] else 0
+        ticker = trade[J_TICKER].upper()
+        entry = float(trade[J_ENTRY]) if trade[J_ENTRY] else 0
+        exit_price = float(trade[J_EXIT]) if trade[J_EXIT] else None
+        shares = int(trade[J_SHARES]) if trade[J_SHARES] else 0
+        pl_pct = float(trade[J_PL_PERCENT]) if trade[J_PL_PERCENT] else 0
+        pl_dollar = float(trade[J_PL_DOLLAR]) if trade[J_PL_DOLLAR] else 0
 
         print(f"\n#{i}: {ticker}")
         print(f"   Entry: ${entry:.2f} × {shares} shares")
@@ -411,28 +434,24 @@ def compare_with_journal(report_date: date, best_picks: List[StockTrajectory], t
 
             # Check if this was a top pick
             if ticker in best_tickers:
-                # Find the trajectory
-                traj = next((t for t in best_picks if t.ticker == ticker), None)
-                if traj:
-                    max_gain = traj.calculate_open_to_peak_gain()
-                    efficiency = (pl_pct / max_gain * 100) if max_gain > 0 else 0
-                    print(f"   ✅ HIT! This was EOD pick #{best_picks.index(traj) + 1}")
-                    print(f"   Max Possible: +{max_gain:.1f}% (you captured {efficiency:.0f}%)")
+                rank, (_, max_gain, _, _) = rank_by_ticker[ticker]
+                efficiency = (pl_pct / max_gain * 100) if max_gain > 0 else 0
+                print(f"   ✅ HIT! This was EOD pick #{rank}")
+                print(f"   Max Possible: +{max_gain:.1f}% (you captured {efficiency:.0f}%)")
             else:
                 print(f"   ℹ️  Not in EOD top 5")
         else:
             print(f"   Status: Still holding")
 
     # Show what was missed
-    traded_tickers = {trade['ticker'].upper() for trade in trades}
+    traded_tickers = {trade[J_TICKER].upper() for trade in trades}
     missed_tickers = best_tickers - traded_tickers
 
     if missed_tickers:
         print(f"\n⚠️  MISSED OPPORTUNITIES (not traded):")
-        for traj in best_picks[:5]:
+        for traj, gain, entry_window, _ in pick_data:
             if traj.ticker in missed_tickers:
-                gain = traj.calculate_open_to_peak_gain()
-                entry_start, entry_end, entry_min, entry_max = traj.get_entry_window()
+                entry_start, entry_end, entry_min, entry_max = entry_window
                 print(f"   {traj.ticker}: +{gain:.1f}% (entry: {entry_start}-{entry_end} @ ${entry_min:.2f}-${entry_max:.2f})")
 
     print("\n" + "="*60)
@@ -475,21 +494,23 @@ def main():
     print(f"Tracked {len(trajectories)} unique tickers")
 
     # Identify best picks (pass threshold to function)
-    best_picks = [t for t in identify_best_picks(trajectories)
-                  if t.calculate_open_to_peak_gain() >= min_gain_threshold]
+    best_picks = identify_best_picks(trajectories, max(MIN_GAIN_PCT, min_gain_threshold))
     print(f"Found {len(best_picks)} catchable opportunities (>{min_gain_threshold}% gain)")
     print()
 
+    # Gain and entry/exit windows for the top 5, shared by every writer
+    pick_data = build_pick_data(best_picks)
+
     # Write reports
-    write_daily_report(report_date, best_picks)
+    write_daily_report(report_date, pick_data)
 
     # Append to missed.csv
     if not args.no_csv:
-        append_to_missed_csv(report_date, best_picks)
+        append_to_missed_csv(report_date, pick_data)
 
     # Load and compare with journal trades
     trades = load_journal_trades(report_date)
-    compare_with_journal(report_date, best_picks, trades)
+    compare_with_journal(report_date, pick_data, trades)
 
 
 if __name__ == "__main__":
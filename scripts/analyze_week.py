@@ -1,10 +1,14 @@
 import csv, os, argparse
-from datetime import datetime, timedelta
-from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+import numpy as np
 
 JOURNAL_PATH_DEFAULT = "output/journal.csv"
 SUMMARY_DIR = "output"
 
+# journal.csv columns read here (see src/core/journal.py JOURNAL_HEADERS)
+J_FIELDS = ("date", "ticker", "pl_dollar", "pl_percent")
+
 def week_bounds(reference_date=None):
     # default: last Monday..Sunday window containing reference (or today)
     today = datetime.today().date() if reference_date is None else reference_date
@@ -13,19 +17,32 @@ def week_bounds(reference_date=None):
     return monday, sunday
 
 def load_rows(path, start_date, end_date):
-    rows = []
-    if not os.path.isfile(path):
-        return rows
-    with open(path, newline="") as f:
-        r = csv.DictReader(f)
-        for row in r:
-            try:
-                d = datetime.strptime(row["date"], "%Y-%m-%d").date()
-            except Exception:
-                continue
-            if start_date <= d <= end_date:
-                rows.append(row)
-    return rows
+    """Journal rows in [start_date, end_date] as column arrays"""
+    tickers, pl_dollar, pl_percent = [], [], []
+    start_ord, end_ord = start_date.toordinal(), end_date.toordinal()
+    if os.path.isfile(path):
+        with open(path, newline="") as f:
+            r = csv.reader(f)
+            header = next(r, None) or []
+            # File column of each J_FIELDS entry, resolved once from the header
+            # (-1 = column absent; absent and short-row cells read as '')
+            position = {name: i for i, name in enumerate(header)}
+            j_date, j_ticker, j_pl_dollar, j_pl_percent = (position.get(n, -1) for n in J_FIELDS)
+            for row in r:
+                width = len(row)
+                try:
+                    d = date.fromisoformat(row[j_date] if 0 <= j_date < width else "").toordinal()
+                except ValueError:
+                    continue
+                if start_ord <= d <= end_ord:
+                    tickers.append(row[j_ticker] if 0 <= j_ticker < width else "")
+                    pl_dollar.append(floaty(row[j_pl_dollar] if 0 <= j_pl_dollar < width else ""))
+                    pl_percent.append(floaty(row[j_pl_percent] if 0 <= j_pl_percent < width else ""))
+    return {
+        "ticker": np.array(tickers, dtype=str),
+        "pl_dollar": np.array(pl_dollar, dtype=np.float64),
+        "pl_percent": np.array(pl_percent, dtype=np.float64),
+    }
 
 def floaty(x, default=0.0):
     try: return float(x)
@@ -36,25 +53,29 @@ def inty(x, default=0):
     except: return default
 
 def summarize(rows):
-    n = len(rows)
-    total_pl = sum(floaty(r["pl_dollar"]) for r in rows)
-    wins = sum(1 for r in rows if floaty(r["pl_dollar"]) > 0)
-    losses = sum(1 for r in rows if floaty(r["pl_dollar"]) < 0)
+    pl = rows["pl_dollar"]
+    n = len(pl)
+    total_pl = float(pl.sum()) if n else 0
+    wins = int((pl > 0).sum())
+    losses = int((pl < 0).sum())
     breakeven = n - wins - losses
     win_rate = (wins / n * 100) if n else 0.0
     avg_pl = (total_pl / n) if n else 0.0
-    avg_pl_pct = sum(floaty(r["pl_percent"]) for r in rows) / n if n else 0.0
-
-    # best/worst
-    best = max(rows, key=lambda r: floaty(r["pl_dollar"]), default=None)
-    worst = min(rows, key=lambda r: floaty(r["pl_dollar"]), default=None)
-
-    # per-ticker aggregates
-    per_ticker = defaultdict(lambda: {"trades":0,"pl":0.0})
-    for r in rows:
-        t = r["ticker"].upper()
-        per_ticker[t]["trades"] += 1
-        per_ticker[t]["pl"] += floaty(r["pl_dollar"])
+    avg_pl_pct = float(rows["pl_percent"].mean()) if n else 0.0
+
+    # best/worst (first row wins ties)
+    best = worst = None
+    if n:
+        i, j = int(pl.argmax()), int(pl.argmin())
+        best = {"ticker": rows["ticker"][i], "pl_dollar": pl[i]}
+        worst = {"ticker": rows["ticker"][j], "pl_dollar": pl[j]}
+
+    # per-ticker aggregates, in order of first appearance
+    uniq, first, inv, counts = np.unique(np.char.upper(rows["ticker"]), return_index=True,
+                                         return_inverse=True, return_counts=True)
+    ticker_pl = np.bincount(inv.ravel(), weights=pl, minlength=len(uniq))
+    per_ticker = {str(uniq[k]): {"trades": int(counts[k]), "pl": float(ticker_pl[k])}
+                  for k in np.argsort(first, kind="stable")}
 
     return {
         "count": n,
@@ -9,47 +9,37 @@ import os
 from datetime import date
 
 JOURNAL_CSV = "output/journal.csv"
+JOURNAL_FIELDS = (
+    'date', 'ticker', 'side', 'entry_price', 'exit_price', 'shares',
+    'total_cost', 'pl_dollar', 'pl_percent', 'plan', 'actual', 'notes'
+)
 
 
-def log_trade(ticker: str, entry: float, exit_price: float, shares: int, notes: str = ""):
-    """Log a completed trade to journal.csv"""
+def log_trade(writer, ticker: str, entry: float, exit_price: float, shares: int, notes: str = ""):
+    """Log a completed trade through an open journal.csv writer"""
 
     # Calculate P/L
     total_cost = entry * shares
     pl_dollar = (exit_price - entry) * shares
     pl_percent = ((exit_price - entry) / entry) * 100
 
-    # Prepare row
-    trade_row = {
-        'date': date.today().strftime('%Y-%m-%d'),
-        'ticker': ticker.upper(),
-        'side': 'long',
-        'entry_price': f"{entry:.2f}",
-        'exit_price': f"{exit_price:.2f}",
-        'shares': shares,
-        'total_cost': f"{total_cost:.2f}",
-        'pl_dollar': f"{pl_dollar:.2f}",
-        'pl_percent': f"{pl_percent:.2f}",
-        'plan': notes,
-        'actual': '',
-        'notes': f"EOD logged - {date.today()}"
-    }
-
-    # Check if file exists
-    file_exists = os.path.isfile(JOURNAL_CSV)
-
-    # Append to journal
-    with open(JOURNAL_CSV, 'a', newline='') as f:
-        fieldnames = [
-            'date', 'ticker', 'side', 'entry_price', 'exit_price', 'shares',
-            'total_cost', 'pl_dollar', 'pl_percent', 'plan', 'actual', 'notes'
-        ]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-
-        if not file_exists:
-            writer.writeheader()
-
-        writer.writerow(trade_row)
+    # Prepare row (JOURNAL_FIELDS order)
+    trade_row = (
+        date.today().strftime('%Y-%m-%d'),
+        ticker.upper(),
+        'long',
+        f"{entry:.2f}",
+        f"{exit_price:.2f}",
+        shares,
+        f"{total_cost:.2f}",
+        f"{pl_dollar:.2f}",
+        f"{pl_percent:.2f}",
+        notes,
+        '',
+        f"EOD logged - {date.today()}"
+    )
+
+    writer.writerow(trade_row)
 
     print(f"✅ Logged: {ticker} - Entry: ${entry:.2f} → Exit: ${exit_price:.2f} = {pl_percent:+.1f}% (${pl_dollar:+.2f})")
 
@@ -117,14 +107,25 @@ def main():
     confirm = input("\nSave to journal? (y/n): ").strip().lower()
 
     if confirm == 'y':
-        for trade in trades:
-            log_trade(
-                ticker=trade['ticker'],
-                entry=trade['entry'],
-                exit_price=trade['exit'],
-                shares=trade['shares'],
-                notes=trade['notes']
-            )
+        # Check if file exists
+        file_exists = os.path.isfile(JOURNAL_CSV)
+
+        # Append all trades to the journal in one go
+        with open(JOURNAL_CSV, 'a', newline='') as f:
+            writer = csv.writer(f)
+
+            if not file_exists:
+                writer.writerow(JOURNAL_FIELDS)
+
+            for trade in trades:
+                log_trade(
+                    writer,
+                    ticker=trade['ticker'],
+                    entry=trade['entry'],
+                    exit_price=trade['exit'],
+                    shares=trade['shares'],
+                    notes=trade['notes']
+                )
 
         print(f"\n✅ {len(trades)} trade(s) saved to {JOURNAL_CSV}")
         print("\nRun EOD analysis to see how you did:")
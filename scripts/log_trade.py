@@ -22,7 +22,7 @@ from datetime import datetime
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
-from src.core.journal import record_trade
+from src.core.journal import record_trades_batch
 
 JOURNAL_PATH = ROOT / "output" / "journal.csv"
 
@@ -41,8 +41,7 @@ def main():
     # If no exit price, this is an open position - use entry price as placeholder
     exit_price = args.exit if args.exit else args.entry
 
-    record_trade(
-        str(JOURNAL_PATH),
+    trades = [dict(
         ticker=args.ticker,
         side="long",
         entry_price=args.entry,
@@ -51,7 +50,8 @@ def main():
         date=args.date,
         plan=args.plan,
         notes=args.notes
-    )
+    )]
+    record_trades_batch(str(JOURNAL_PATH), trades)
 
     if args.exit:
         pl_pct = ((exit_price - args.entry) / args.entry) * 100
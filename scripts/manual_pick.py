@@ -20,6 +20,8 @@ from datetime import datetime
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
+from src.core.output import fresh_feather_sidecar, write_feather_sidecar
+
 TODAY_PICK_CSV = ROOT / "output" / "today_pick.csv"
 
 def show_picks():
@@ -28,9 +30,15 @@ def show_picks():
         print("❌ No picks file found at:", TODAY_PICK_CSV)
         return
 
-    with open(TODAY_PICK_CSV, 'r') as f:
-        reader = csv.DictReader(f)
-        picks = list(reader)
+    feather = fresh_feather_sidecar(TODAY_PICK_CSV)
+    if feather:
+        import pandas as pd
+        # Blank cells come back as NaN; show them like the CSV would
+        picks = pd.read_feather(feather).fillna('').astype(str).to_dict(orient='records')
+    else:
+        with open(TODAY_PICK_CSV, 'r') as f:
+            reader = csv.DictReader(f)
+            picks = list(reader)
 
     if not picks:
         print("📋 No picks recorded yet")
@@ -42,20 +50,27 @@ def show_picks():
         gap = pick.get('gap_pct', 'N/A')
         score = pick.get('score', 'N/A')
         final = pick.get('final_pick', 'FALSE')
-        flag = "✅ FINAL" if final == "TRUE" else ""
+        flag = "✅ FINAL" if final.upper() == "TRUE" else ""
         print(f"  {i}. {ticker} - gap={gap}%, score={score} {flag}")
 
 def override_pick(ticker: str):
     """Override the pick with manual selection"""
-    ticker = ticker.upper()
+    override_picks([ticker])
 
-    print(f"🔄 Manually overriding pick to: {ticker}")
+def override_picks(tickers: list):
+    """Override the pick with one or more manual selections (one file open for all)"""
+    tickers = [t.upper() for t in tickers]
+
+    print(f"🔄 Manually overriding pick to: {', '.join(tickers)}")
     print(f"⚠️  Note: This creates a placeholder entry. Add details manually or wait for next scan.")
 
-    # Create manual entry
-    row = {
-        'date': datetime.now().strftime('%Y-%m-%d'),
-        'time': datetime.now().strftime('%H:%M'),
+    now = datetime.now()
+    date_str, time_str = now.strftime('%Y-%m-%d'), now.strftime('%H:%M')
+
+    # Create manual entries
+    rows = [{
+        'date': date_str,
+        'time': time_str,
         'ticker': ticker,
         'gap_pct': '',
         'rvol': '',
@@ -65,14 +80,15 @@ def override_pick(ticker: str):
         'score': '',
         'final_pick': 'TRUE',
         'rationale': f'Manual override - automated pick not tradeable'
-    }
+    } for ticker in tickers]
 
     # Append to CSV
     with open(TODAY_PICK_CSV, 'a', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=row.keys())
-        writer.writerow(row)
+        writer = csv.DictWriter(f, fieldnames=rows[0].keys())
+        writer.writerows(rows)
+    write_feather_sidecar(TODAY_PICK_CSV)
 
-    print(f"✅ Pick updated: {ticker}")
+    print(f"✅ Pick updated: {', '.join(tickers)}")
     print(f"📊 File: {TODAY_PICK_CSV}")
 
 def main():
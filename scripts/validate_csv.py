@@ -1,19 +1,86 @@
 import sys
 import json
+from pathlib import Path
+
 import pandas as pd
-from jsonschema import validate, ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.core.output import fresh_feather_sidecar, write_feather_sidecar
+
+try:
+    import jsonschema_rs  # optional: compiled (Rust) validator
+except ImportError:
+    jsonschema_rs = None
+
+try:
+    import pyarrow as pa  # optional: multithreaded CSV reader
+    import pyarrow.csv as pv
+except ImportError:
+    pa = pv = None
+
+
+def compile_schema(schema):
+    """Build a validator once; returns (is_valid, error_message) callables."""
+    if jsonschema_rs is not None:
+        build = getattr(jsonschema_rs, "validator_for", None) or jsonschema_rs.JSONSchema
+        v = build(schema)
+        return v.is_valid, lambda record: next(v.iter_errors(record)).message
+
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    v = cls(schema)
+    return v.is_valid, lambda record: best_match(v.iter_errors(record)).message
+
+
+def _arrow_column_types(schema):
+    """Pin schema string/number/integer columns so Arrow doesn't infer dates/times."""
+    types = {}
+    for name, prop in schema.get("properties", {}).items():
+        t = prop.get("type")
+        t = t if isinstance(t, list) else [t]
+        if "string" in t:
+            types[name] = pa.string()
+        elif "number" in t:
+            types[name] = pa.float64()
+        elif "integer" in t:
+            types[name] = pa.int64()
+    return types
+
+
+def read_frame(csv_file, schema):
+    """CSV as a DataFrame; blank cells pass/fail the same schema checks as with pandas."""
+    if pv is not None:
+        opts = pv.ConvertOptions(column_types=_arrow_column_types(schema), strings_can_be_null=True)
+        try:
+            return pv.read_csv(csv_file, convert_options=opts).to_pandas()
+        except pa.ArrowInvalid:
+            pass  # a value doesn't fit its schema type; let pandas load it so validation reports it
+    return pd.read_csv(csv_file)
+
+
+def read_records(csv_file, schema):
+    """CSV rows as dicts, via the Feather sidecar when fresh (rebuilt here when stale)."""
+    feather = fresh_feather_sidecar(csv_file)
+    if feather:
+        return pd.read_feather(feather).to_dict(orient="records")
+    df = read_frame(csv_file, schema)
+    write_feather_sidecar(csv_file, df)
+    return df.to_dict(orient="records")
+
 
 def validate_csv(csv_file, schema_file):
     with open(schema_file) as f:
         schema = json.load(f)
 
-    df = pd.read_csv(csv_file)
-    for i, row in df.iterrows():
-        record = row.to_dict()
-        try:
-            validate(instance=record, schema=schema)
-        except ValidationError as e:
-            print(f"Row {i} failed validation: {e.message}")
+    is_valid, error_message = compile_schema(schema)
+
+    for i, record in enumerate(read_records(csv_file, schema)):
+        if not is_valid(record):
+            print(f"Row {i} failed validation: {error_message(record)}")
             return False
     print(f"{csv_file} passed validation ✅")
     return True
@@ -0,0 +1,153 @@
+# -------------------------------------------------------------------
+# FILE: src/adapters/_cache.py
+# PURPOSE: TTL cache for deterministic Polygon lookups.
+# NOTES:
+#   - L1: in-process dict (bounded, per-entry expiry)
+#   - L2: Redis when the `redis` package is installed and REDIS_URL is set,
+#         so values survive restarts and are shared across processes
+#   - Any Redis error falls through to calling the wrapped function
+#   - Exceptions from the wrapped function are never cached
+#   - Redis values are JSON (orjson bytes when installed)
+# -------------------------------------------------------------------
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import redis  # optional: shared L2 cache
+except ImportError:
+    redis = None
+
+try:
+    import orjson  # optional: bytes in/out, faster than stdlib json
+except ImportError:
+    orjson = None
+
+L1_MAXSIZE = 4096
+KEY_PREFIX = "polygon"
+
+log = logging.getLogger(__name__)
+
+_REDIS: Optional["redis.Redis"] = None
+_REDIS_CHECKED = False
+_REDIS_LOCK = threading.Lock()
+
+# name -> TTLCache, for stats()
+_REGISTRY: Dict[str, "TTLCache"] = {}
+
+
+if orjson is not None:
+    _dumps, _loads = orjson.dumps, orjson.loads
+else:
+    _dumps, _loads = json.dumps, json.loads
+
+
+def _redis() -> Optional["redis.Redis"]:
+    global _REDIS, _REDIS_CHECKED
+    if not _REDIS_CHECKED:
+        with _REDIS_LOCK:
+            if not _REDIS_CHECKED:
+                url = os.getenv("REDIS_URL")
+                if redis is not None and url:
+                    _REDIS = redis.Redis.from_url(url, socket_timeout=0.25)
+                _REDIS_CHECKED = True
+    return _REDIS
+
+
+class TTLCache:
+    """One named cache namespace: bounded L1 dict in front of the optional Redis L2."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._l1: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._counts = {"hits": 0, "misses": 0}
+        _REGISTRY[name] = self
+
+    def key(self, *parts: Any) -> str:
+        return ":".join([KEY_PREFIX, self.name, *map(str, parts)])
+
+    def get_or_set(self, key: str, ttl: float, compute: Callable[[], Any]) -> Any:
+        """Cached value for `key`, else compute() stored for `ttl` seconds (exceptions aren't stored)."""
+        now = time.time()
+
+        # L1 reads and hit/miss counts under the lock: enrichment threads share caches
+        with self._lock:
+            entry = self._l1.get(key)
+            if entry is not None and entry[0] > now:
+                self._counts["hits"] += 1
+                return entry[1]
+
+        r = _redis()
+        if r is not None:
+            try:
+                raw = r.get(key)
+                if raw is not None:
+                    value = _loads(raw)
+                    self._remember(key, now + ttl, value, hit=True)
+                    return value
+            except Exception as e:
+                log.debug(f"redis get failed for {key}: {e}")
+
+        with self._lock:
+            self._counts["misses"] += 1
+        value = compute()  # outside the lock, so slow fetches don't serialise callers
+        self._remember(key, now + ttl, value)
+        if r is not None:
+            try:
+                r.set(key, _dumps(value), ex=max(int(ttl), 1))
+            except Exception as e:
+                log.debug(f"redis set failed for {key}: {e}")
+        return value
+
+    def _remember(self, key: str, expires: float, value: Any, hit: bool = False) -> None:
+        with self._lock:
+            if hit:
+                self._counts["hits"] += 1
+            if key not in self._l1 and len(self._l1) >= L1_MAXSIZE:
+                self._l1.pop(next(iter(self._l1)))  # oldest insert first
+            self._l1[key] = (expires, value)
+
+    def clear(self) -> None:
+        """Empty L1 (Redis entries expire on their own TTL)."""
+        with self._lock:
+            self._l1.clear()
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts, size=len(self._l1))
+
+
+def cached(ttl, scope: Optional[Callable[[], str]] = None):
+    """
+    Memoise fn(*args) under "polygon:{fn}:{arg}:{arg}...".
+    `ttl` is seconds, or a callable ttl(*args) -> seconds for lookups whose
+    freshness depends on the arguments (e.g. today's bars vs a closed day).
+    `scope` adds a key part computed per call (e.g. today's date) for lookups
+    whose arguments alone don't pin the answer down.
+    """
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        cache = TTLCache(fn.__name__.lstrip("_"))
+
+        @functools.wraps(fn)
+        def wrapper(*args):
+            key = cache.key(*args, scope()) if scope is not None else cache.key(*args)
+            seconds = ttl(*args) if callable(ttl) else ttl
+            return cache.get_or_set(key, seconds, lambda: fn(*args))
+
+        wrapper.cache_clear = cache.clear
+        wrapper.cache_info = cache.info
+        return wrapper
+
+    return decorator
+
+
+def stats() -> Dict[str, Dict[str, int]]:
+    """{function: {hits, misses, size}} for every cached helper."""
+    return {name: c.info() for name, c in _REGISTRY.items()}
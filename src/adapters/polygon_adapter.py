@@ -11,75 +11,375 @@
 from __future__ import annotations
 
 import os
-import calendar
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
-
-import pytz
+import json
+import functools
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import numpy as np
 import requests
+from urllib3.util.retry import Retry
+
+from src.adapters._cache import cached
+from src.core.env import load as load_env
+
+try:
+    import simdjson  # optional: SIMD JSON parser, preferred for large payloads
+except ImportError:
+    simdjson = None
+
+try:
+    import orjson  # optional: faster decoding of large aggregate payloads
+except ImportError:
+    orjson = None
+
+try:
+    import brotli  # noqa: F401  (optional: lets requests/httpx decode `br` responses)
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+try:
+    import pandas_market_calendars as mcal  # optional: exact NYSE sessions (holidays included)
+except ImportError:
+    mcal = None
 
 BASE_URL = "https://api.polygon.io"
+# Per-ticker endpoint templates (str.format), built once instead of per call
+_PREV_URL = BASE_URL + "/v2/aggs/ticker/{}/prev"
+_MINUTE_URL = BASE_URL + "/v2/aggs/ticker/{}/range/1/minute/{}/{}"
+_DAY_URL = BASE_URL + "/v2/aggs/ticker/{}/range/1/day/{}/{}"
+_SNAPSHOT_URL = BASE_URL + "/v2/snapshot/locale/us/markets/stocks/tickers/{}"
+_NY_TZ = ZoneInfo("America/New_York")
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MS = timedelta(milliseconds=1)
 HTTP_TIMEOUT = 30  # seconds
+HTTP_POOL_SIZE = 32  # connection pools (hosts) kept by the shared Session
+HTTP_POOL_MAXSIZE = 64  # keep-alive connections per host, shared by all helpers/threads
+ENRICH_WORKERS = 16  # threads used by enrich_tickers (<= HTTP_POOL_MAXSIZE)
+MAX_INFLIGHT_REQUESTS = 16  # process-wide cap on concurrent enrichment calls
+
+_REQUEST_SLOTS = threading.BoundedSemaphore(MAX_INFLIGHT_REQUESTS)
+
+log = logging.getLogger(__name__)
+
+HOLIDAY_SLACK_WEEKDAYS = 4  # spare weekdays per daily window when no exchange calendar is installed
+SNAPSHOT_BATCH = 250  # symbols per bulk snapshot request (keeps the URL well under limits)
+DAILY_TTL = 86400  # seconds; daily values don't change once the session has closed
+INTRADAY_TTL = 60  # seconds; today's daily bar is still forming
+GROUPED_DAILY_MIN_TICKERS = 20  # enrich_tickers prewarms grouped bars at/above this many tickers
+
+# Grouped daily bars: {"YYYY-MM-DD": {ticker: {o,h,l,c,v}}}; filled by prewarm_daily_cache
+_DAILY_BARS: Dict[str, Dict[str, Dict[str, float]]] = {}
+# When each date was fetched: (ET date key at fetch time, time.monotonic())
+_DAILY_BARS_FETCHED: Dict[str, Tuple[str, float]] = {}
+
+_API_KEY: Optional[str] = None
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+# _json's simdjson parser reuses one internal buffer, so each worker thread gets its own
+_LOCAL = threading.local()
 
 
 # ---------------------------- helpers --------------------------------
 def _require_api_key() -> str:
-    api_key = os.getenv("POLYGON_API_KEY")
-    if not api_key:
-        raise RuntimeError("❌ No POLYGON_API_KEY found in environment or .env file")
-    return api_key
+    # Read once, on first use, so importing this module stays free of file I/O
+    global _API_KEY
+    if _API_KEY is None:
+        _API_KEY = load_env().get("POLYGON_API_KEY")
+        if not _API_KEY:
+            _API_KEY = None
+            raise RuntimeError("❌ No POLYGON_API_KEY found in environment or .env file")
+    return _API_KEY
+
+
+def refresh_api_key() -> str:
+    """Re-read POLYGON_API_KEY (for long-running processes after a key rotation)."""
+    global _API_KEY
+    _API_KEY = None
+    return _require_api_key()
+
+
+def _retry_policy() -> Retry:
+    """
+    Retry 429/5xx (not just connection errors) with exponential backoff,
+    honoring Polygon's Retry-After header under rate-limit pressure.
+    raise_on_status=False hands the last response back so callers
+    still see an HTTPError from raise_for_status().
+    """
+    return Retry(total=5, backoff_factor=0.5,
+                 status_forcelist=[429, 500, 502, 503, 504],
+                 allowed_methods=["GET"],
+                 respect_retry_after_header=True,
+                 raise_on_status=False)
+
+
+def _http_adapter() -> requests.adapters.HTTPAdapter:
+    return requests.adapters.HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=_retry_policy(),
+    )
 
 
-def _session() -> requests.Session:
-    s = requests.Session()
-    s.headers.update({"User-Agent": "polygon-stock-tracker/1.0"})
-    s.mount("https://", requests.adapters.HTTPAdapter(max_retries=3))
-    return s
+def _get_session() -> requests.Session:
+    """
+    Shared keep-alive Session for all adapter calls (created on first use).
+    Reusing it avoids a fresh TCP+TLS handshake per request.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                s = requests.Session()
+                s.headers.update({
+                    "User-Agent": "polygon-stock-tracker/1.0",
+                    "Connection": "keep-alive",
+                    # Explicit so compressed transfer never depends on library defaults;
+                    # minute-bar payloads shrink ~10x gzipped
+                    "Accept-Encoding": ACCEPT_ENCODING,
+                })
+                s.mount("https://", _http_adapter())
+                _SESSION = s
+    return _SESSION
+
+
+def _do_get(url: str, params: Optional[Dict[str, Any]]) -> requests.Response:
+    """
+    GET through the shared Session; raises HTTPError on a bad status.
+    Retries live in one place, the Session's urllib3 Retry (_retry_policy):
+    429/5xx, failed connects and read timeouts, with backoff.
+    """
+    resp = _get_session().get(url, params=params, timeout=HTTP_TIMEOUT)
+    resp.raise_for_status()
+    return resp
+
 
+def _simdjson_parser() -> "simdjson.Parser":
+    parser = getattr(_LOCAL, "parser", None)
+    if parser is None:
+        parser = _LOCAL.parser = simdjson.Parser()
+    return parser
+
+
+def _json(resp: requests.Response) -> Any:
+    """Decode a response body (simdjson, then orjson, when installed; stdlib json otherwise)."""
+    if simdjson is not None:
+        # recursive=True materialises plain dicts/lists, so nothing keeps the parser buffer alive
+        return _simdjson_parser().parse(resp.content, recursive=True)
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return json.loads(resp.content)
+
+
+def _json_doc(resp: requests.Response) -> Any:
+    """
+    Like _json, but with simdjson the result is a lazy proxy: only the fields
+    read through _ptr become Python objects. Each document gets its own parser
+    (a proxy pins its parser's buffer), so docs can outlive later parses, e.g.
+    across pages or awaits.
+    """
+    if simdjson is not None:
+        return simdjson.Parser().parse(resp.content)
+    return _json(resp)
+
+
+def _ptr(doc: Any, pointer: str) -> Any:
+    """JSON-pointer lookup ('/day/v') on a simdjson proxy or plain dict; None if missing."""
+    if simdjson is not None and not isinstance(doc, dict):
+        try:
+            return doc.at_pointer(pointer)
+        except Exception:
+            return None
+    for key in pointer[1:].split("/"):
+        if isinstance(doc, dict):
+            doc = doc.get(key)
+        elif isinstance(doc, list) and key.isdigit():
+            doc = doc[int(key)] if int(key) < len(doc) else None
+        else:
+            return None
+    return doc
+
+
+# Snapshot row fields -> JSON pointer inside one Polygon ticker snapshot
+_SNAPSHOT_FIELDS = (
+    ("ticker", "/ticker"),
+    ("last_price", "/lastTrade/p"),
+    ("prev_close", "/prevDay/c"),
+    ("volume", "/day/v"),   # today's volume (exchange session)
+    ("open", "/day/o"),
+    ("high", "/day/h"),
+    ("low", "/day/l"),
+    ("close", "/day/c"),
+)
+
+
+def _snapshot_row(t: Any) -> Dict[str, Any]:
+    return {key: _ptr(t, pointer) for key, pointer in _SNAPSHOT_FIELDS}
 
 
 def to_unix_ms(dt: datetime) -> int:
     """Convert aware datetime -> unix epoch milliseconds (UTC)."""
     if dt.tzinfo is None:
         raise ValueError("Datetime must be timezone-aware")
-    return int(calendar.timegm(dt.utctimetuple()) * 1000)
+    # Integer timedelta division: exact, no float round-trip through timestamp()
+    return (dt - _EPOCH_UTC) // _ONE_MS
+
+
+@functools.lru_cache(maxsize=32)
+def _query(api_key: str, sort: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+    """Aggregate-endpoint query params, built once per (key, sort, limit). Shared: never mutate."""
+    params: Dict[str, Any] = {"adjusted": "true"}
+    if sort:
+        params["sort"] = sort
+    if limit:
+        params["limit"] = limit
+    params["apiKey"] = api_key
+    return params
 
 
 def _today_ny() -> datetime:
-    return datetime.now(pytz.timezone("America/New_York"))
+    return datetime.now(_NY_TZ)
+
+
+def _today_key() -> str:
+    return _today_ny().date().isoformat()
+
+
+@functools.lru_cache(maxsize=256)
+def _ny_ms(date: str, hhmmss: str) -> int:
+    """'YYYY-MM-DD' + 'HH:MM:SS' wall-clock time in New York -> unix epoch ms."""
+    # fromisoformat is C-parsed; strptime re-interprets its format string every call
+    dt = datetime.fromisoformat(f"{date} {hhmmss}").replace(tzinfo=_NY_TZ)
+    return to_unix_ms(dt)
+
+
+@functools.lru_cache(maxsize=1)
+def _nyse_sessions() -> Optional[np.ndarray]:
+    """XNYS session dates (datetime64[D]) from 2020 to ~90 days out; None without pandas_market_calendars."""
+    if mcal is None:
+        return None
+    end = _today_ny().date() + timedelta(days=90)
+    days = mcal.get_calendar("XNYS").valid_days(start_date="2020-01-01", end_date=end.isoformat())
+    return np.asarray(days.date, dtype="datetime64[D]")
+
+
+def _recent_sessions(n: int) -> List[date]:
+    """
+    The last `n` trading sessions up to and including today (ET), newest first.
+    Without an exchange calendar this is weekdays plus HOLIDAY_SLACK_WEEKDAYS spare.
+    """
+    today = np.datetime64(_today_ny().date(), "D")
+    sessions = _nyse_sessions()
+    if sessions is not None:
+        i = int(np.searchsorted(sessions, today, side="right"))
+        picked = sessions[max(i - n, 0):i][::-1]
+    else:
+        last = np.busday_offset(today, 0, roll="backward")
+        picked = np.busday_offset(last, -np.arange(n + HOLIDAY_SLACK_WEEKDAYS))
+    return picked.astype(object).tolist()
+
+
+def _nth_session_ago(n: int) -> date:
+    """Date of the session `n` trading days before today (ET)."""
+    return _recent_sessions(n + 1)[-1]
 
 
 # ------------------------- snapshots adapter --------------------------
+def iter_snapshots(limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield latest snapshot data for US stocks from Polygon, one ticker at a time.
+    Pages are only requested as the caller consumes them, so breaking out
+    early skips the remaining requests.
+    """
+    api_key = _require_api_key()
+    url: Optional[str] = f"{BASE_URL}/v2/snapshot/locale/us/markets/stocks/tickers"
+    params: Dict[str, Any] = {"apiKey": api_key}
+    if limit:
+        params["limit"] = limit
+
+    while url:
+        resp = _do_get(url, params)
+        doc = _json_doc(resp)
+
+        # Pull the 8 scalars per ticker straight out of the (lazy) document
+        # up front, so the page's buffer isn't held while the caller consumes rows
+        rows = [_snapshot_row(t) for t in (_ptr(doc, "/tickers") or [])]
+        # next_url already carries the query; only the key needs re-adding
+        url = _ptr(doc, "/next_url")
+        params = {"apiKey": api_key}
+
+        yield from rows
+
+
 def fetch_snapshots(limit: int = 50) -> List[Dict[str, Any]]:
     """
     Fetch latest snapshot data for US stocks from Polygon.
     Returns a list of dicts with ticker + basic prices.
     """
+    return list(itertools.islice(iter_snapshots(limit), limit or None))
+
+
+def _float_column(values: List[Any]) -> np.ndarray:
+    try:
+        return np.array(values, dtype=np.float64)  # None -> NaN
+    except (TypeError, ValueError):
+        # Some value isn't numeric: coerce just those to NaN
+        return np.array([_to_float(v) for v in values], dtype=np.float64)
+
+
+def _to_float(v: Any) -> float:
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def snapshot_columns(rows: List[Dict[str, Any]], keys: Iterable[str]) -> Dict[str, np.ndarray]:
+    """{key: float64 array} over snapshot rows (missing / non-numeric -> NaN)."""
+    return {k: _float_column([r.get(k) for r in rows]) for k in keys}
+
+
+def snapshots_frame(rows: Iterable[Dict[str, Any]]):
+    """
+    Snapshot rows as a pandas DataFrame: one column per snapshot field,
+    prices/volume as float64 (missing -> NaN), for vectorized filtering.
+    """
+    import pandas as pd  # only the DataFrame paths need pandas
+
+    rows = list(rows)
+    keys = [key for key, _ in _SNAPSHOT_FIELDS]
+    columns: Dict[str, Any] = {"ticker": [r.get("ticker") for r in rows]}
+    columns.update(snapshot_columns(rows, keys[1:]))
+    return pd.DataFrame(columns, columns=keys)
+
+
+def fetch_snapshots_df(limit: int = 50):
+    """fetch_snapshots as a typed DataFrame (see snapshots_frame)."""
+    return snapshots_frame(itertools.islice(iter_snapshots(limit), limit or None))
+
+
+def fetch_snapshots_for(tickers: List[str]) -> List[Dict[str, Any]]:
+    """
+    Snapshots for specific tickers via the bulk endpoint's `tickers=` filter:
+    one request per SNAPSHOT_BATCH symbols instead of one per ticker.
+    Same row shape as fetch_snapshots; tickers Polygon doesn't know are absent.
+    """
     api_key = _require_api_key()
     url = f"{BASE_URL}/v2/snapshot/locale/us/markets/stocks/tickers"
-    params = {"limit": limit, "apiKey": api_key}
-
-    with _session() as s:
-        resp = s.get(url, params=params, timeout=HTTP_TIMEOUT)
-        resp.raise_for_status()
-        data = resp.json()
-
-    tickers = data.get("tickers", []) or []
-    out: List[Dict[str, Any]] = []
-    for t in tickers:
-        out.append(
-            {
-                "ticker": t.get("ticker"),
-                "last_price": t.get("lastTrade", {}).get("p"),
-                "prev_close": t.get("prevDay", {}).get("c"),
-                "volume": t.get("day", {}).get("v"),   # today's volume (exchange session)
-                "open": t.get("day", {}).get("o"),
-                "high": t.get("day", {}).get("h"),
-                "low": t.get("day", {}).get("l"),
-                "close": t.get("day", {}).get("c"),
-            }
-        )
-    return out
+    rows: List[Dict[str, Any]] = []
+    for i in range(0, len(tickers), SNAPSHOT_BATCH):
+        params = {"tickers": ",".join(tickers[i:i + SNAPSHOT_BATCH]), "apiKey": api_key}
+        resp = _do_get(url, params)
+        rows.extend(_snapshot_row(t) for t in (_ptr(_json_doc(resp), "/tickers") or []))
+    return rows
 
 
 ## -------------------------------------------------------------------
@@ -91,194 +391,374 @@ def fetch_snapshots(limit: int = 50) -> List[Dict[str, Any]]:
 ## -------------------------------------------------------------------
 def get_snapshot(ticker: str) -> Dict[str, Any]:
     api_key = _require_api_key()
-    url = f"{BASE_URL}/v2/snapshot/locale/us/markets/stocks/tickers/{ticker}"
-
-    with _session() as s:
-        resp = s.get(url, params={"apiKey": api_key}, timeout=HTTP_TIMEOUT)
-        resp.raise_for_status()
-        data = resp.json() or {}
+    url = _SNAPSHOT_URL.format(ticker)
 
-    t = data.get("ticker", {})
+    resp = _do_get(url, {"apiKey": api_key})
+    t = _ptr(_json_doc(resp), "/ticker")
     if not t:
         return {}
 
-    return {
-        "ticker": t.get("ticker"),
-        "last_price": t.get("lastTrade", {}).get("p"),
-        "prev_close": t.get("prevDay", {}).get("c"),
-        "volume": t.get("day", {}).get("v"),
-        "open": t.get("day", {}).get("o"),
-        "high": t.get("day", {}).get("h"),
-        "low": t.get("day", {}).get("l"),
-        "close": t.get("day", {}).get("c"),
-    }
+    return _snapshot_row(t)
 ## -------------------------------------------------------------------
 
 
 # --------------------------- previous close ---------------------------
+# Request builders (url, params) and result parsers below are shared with
+# the async adapter (src/adapters/polygon_async.py).
+def _prev_close_request(ticker: str) -> Tuple[str, Dict[str, Any]]:
+    return _PREV_URL.format(ticker), _query(_require_api_key())
+
+
+def _parse_prev_close(doc: Any) -> float:
+    # Only the one number we need is pulled out of the (lazy) document
+    close = _ptr(doc, "/results/0/c")
+    return 0.0 if close is None else close
+
+
+@cached(ttl=DAILY_TTL, scope=_today_key)
 def get_previous_close(ticker: str) -> float:
-    api_key = _require_api_key()
-    url = f"{BASE_URL}/v2/aggs/ticker/{ticker}/prev"
-    params = {"adjusted": "true", "apiKey": api_key}
+    url, params = _prev_close_request(ticker)
+
+    resp = _do_get(url, params)
+
+    return _parse_prev_close(_json_doc(resp))
+
+
+# ------------------------- day minute bars ----------------------------
+def _day_end_ms(trade_date: str) -> int:
+    """End of the 04:00-20:00 ET window; 'now' (floored to the minute) for today."""
+    now_ny = _today_ny()
+    # If you're querying a past date, cap at that day's 20:00 to avoid future bars
+    if trade_date == now_ny.date().isoformat():
+        return to_unix_ms(now_ny.replace(second=0, microsecond=0))
+    return _ny_ms(trade_date, "20:00:00")
+
+
+def _minute_bars_request(ticker: str, trade_date: str, end_ms: int) -> Tuple[str, Dict[str, Any]]:
+    start_ms = _ny_ms(trade_date, "04:00:00")
+    return _MINUTE_URL.format(ticker, start_ms, end_ms), _query(_require_api_key(), "asc", 50000)
+
+
+def _bar_arrays(bars) -> Dict[str, np.ndarray]:
+    """Minute bars (dicts or simdjson objects) -> read-only column arrays t/o/h/v."""
+    n = len(bars)
+    cols = {
+        "t": np.fromiter((b.get("t") or 0 for b in bars), dtype=np.int64, count=n),
+        "o": np.fromiter((b.get("o") or 0.0 for b in bars), dtype=np.float64, count=n),
+        "h": np.fromiter((b.get("h") or 0.0 for b in bars), dtype=np.float64, count=n),
+        "v": np.fromiter((b.get("v") or 0 for b in bars), dtype=np.float64, count=n),
+    }
+    for arr in cols.values():
+        arr.flags.writeable = False  # shared through the cache
+    return cols
 
-    with _session() as s:
-        resp = s.get(url, params=params, timeout=HTTP_TIMEOUT)
-        resp.raise_for_status()
-        results = resp.json().get("results", []) or []
 
-    return results[0].get("c", 0.0) if results else 0.0
+@functools.lru_cache(maxsize=1024)
+def _fetch_day_minute_bars(ticker: str, trade_date: str, end_ms: int) -> Dict[str, np.ndarray]:
+    url, params = _minute_bars_request(ticker, trade_date, end_ms)
+
+    resp = _do_get(url, params)
+    return _bar_arrays(_ptr(_json_doc(resp), "/results") or [])
+
+
+def get_day_minute_bars(ticker: str, trade_date: str) -> Dict[str, np.ndarray]:
+    """
+    All 1-minute bars from 04:00 ET to 20:00 ET (or now, for today) on trade_date,
+    as column arrays {t (epoch ms), o, h, v}.
+    Cached, so premarket high, intraday volume and the 09:30 open share one request;
+    today's window is keyed by the current minute so it doesn't go stale.
+    """
+    return _fetch_day_minute_bars(ticker, trade_date, _day_end_ms(trade_date))
 
 
 # --------------------------- premarket high ---------------------------
+def _parse_premarket_high(bars: Dict[str, np.ndarray], date: str) -> float:
+    highs = bars["h"][bars["t"] < _ny_ms(date, "09:30:00")]
+    return float(highs.max()) if highs.size else 0.0
+
+
 def get_premarket_high(ticker: str, date: str) -> float:
     """
     Highest price between 04:00:00 and 09:29:59 ET for the given trade date.
-    Uses 1-minute aggregates with UNIX ms range.
+    Sliced from the day's cached 1-minute bars.
     """
-    api_key = _require_api_key()
-    ny = pytz.timezone("America/New_York")
-    start_dt = ny.localize(datetime.strptime(f"{date} 04:00:00", "%Y-%m-%d %H:%M:%S"))
-    end_dt = ny.localize(datetime.strptime(f"{date} 09:29:59", "%Y-%m-%d %H:%M:%S"))
+    return _parse_premarket_high(get_day_minute_bars(ticker, date), date)
 
-    start_ms = to_unix_ms(start_dt.astimezone(pytz.UTC))
-    end_ms = to_unix_ms(end_dt.astimezone(pytz.UTC))
 
-    url = f"{BASE_URL}/v2/aggs/ticker/{ticker}/range/1/minute/{start_ms}/{end_ms}"
-    params = {"adjusted": "true", "sort": "asc", "limit": 50000, "apiKey": api_key}
+# ------------------------------ ATR(14) -------------------------------
+def _atr_request(ticker: str, trade_date: str) -> Tuple[str, Dict[str, Any]]:
+    end = date.fromisoformat(trade_date)
+    start = end - timedelta(days=40)  # generous buffer for 14 obs
+    return _DAY_URL.format(ticker, start, end), _query(_require_api_key(), "asc", 200)
 
-    with _session() as s:
-        resp = s.get(url, params=params, timeout=HTTP_TIMEOUT)
-        resp.raise_for_status()
-        bars = resp.json().get("results", []) or []
 
-    highs = [bar.get("h", 0.0) for bar in bars]
-    return max(highs) if highs else 0.0
+def _parse_atr(bars) -> float:
+    """ATR(14) from ascending daily bars (dicts or simdjson objects); 1.0 when there isn't enough history."""
+    if len(bars) < 15:
+        return 1.0  # not enough history
+
+    n = len(bars)
+    highs = np.fromiter((b.get("h") or 0.0 for b in bars), dtype=np.float64, count=n)
+    lows = np.fromiter((b.get("l") or 0.0 for b in bars), dtype=np.float64, count=n)
+    closes = np.fromiter((b.get("c") or 0.0 for b in bars), dtype=np.float64, count=n)
+
+    # True range vs. the previous bar's close
+    h, l, prev_c = highs[1:], lows[1:], closes[:-1]
+    trs = np.maximum.reduce([h - l, np.abs(h - prev_c), np.abs(l - prev_c)])
+
+    atr = float(trs[-14:].mean())
+    return round(atr, 4) if atr > 0 else 1.0
+
+
+def _daily_ttl(ticker: str, trade_date: str) -> float:
+    # A window ending today includes today's partial bar
+    return DAILY_TTL if trade_date < _today_key() else INTRADAY_TTL
+
+
+@cached(ttl=_daily_ttl)
+def _fetch_atr_14(ticker: str, trade_date: str) -> float:
+    # Cached separately from get_atr_14 so a failed call isn't memoised as 1.0
+    url, params = _atr_request(ticker, trade_date)
+
+    resp = _do_get(url, params)
+    # With simdjson the bars stay lazy proxies; _parse_atr reads h/l/c straight into arrays
+    bars = _ptr(_json_doc(resp), "/results") or []
+
+    return _parse_atr(bars)
 
 
-# ------------------------------ ATR(14) -------------------------------
 def get_atr_14(ticker: str, trade_date: str) -> float:
     """
     Compute 14-day ATR using Polygon daily bars up to `trade_date`.
     Falls back to 1.0 if insufficient data or on error.
     """
     try:
-        api_key = _require_api_key()
-        end = datetime.strptime(trade_date, "%Y-%m-%d")
-        start = end - timedelta(days=40)  # generous buffer for 14 obs
-
-        url = f"{BASE_URL}/v2/aggs/ticker/{ticker}/range/1/day/{start.strftime('%Y-%m-%d')}/{end.strftime('%Y-%m-%d')}"
-        params = {"adjusted": "true", "sort": "asc", "limit": 200, "apiKey": api_key}
-
-        with _session() as s:
-            resp = s.get(url, params=params, timeout=HTTP_TIMEOUT)
-            resp.raise_for_status()
-            bars = resp.json().get("results", []) or []
-
-        if len(bars) < 15:
-            return 1.0  # not enough history
-
-        trs: List[float] = []
-        for i in range(1, len(bars)):
-            high = float(bars[i].get("h", 0.0) or 0.0)
-            low = float(bars[i].get("l", 0.0) or 0.0)
-            prev_close = float(bars[i - 1].get("c", 0.0) or 0.0)
-            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
-            trs.append(tr)
-
-        atr = sum(trs[-14:]) / 14
-        return round(atr, 4) if atr > 0 else 1.0
+        return _fetch_atr_14(ticker, trade_date)
     except Exception:
         return 1.0
 
 
 # --------------------------- intraday volume --------------------------
+def _sum_volume(bars: Dict[str, np.ndarray]) -> int:
+    # astype truncates each bar like int() did
+    return int(bars["v"].astype(np.int64).sum())
+
+
 def get_intraday_volume(ticker: str, trade_date: str) -> int:
     """
     Return cumulative intraday volume from 04:00 ET up to 'now' ET for trade_date.
-    Uses 1-minute aggregates; sums 'v' across bars.
+    Sums 'v' across the day's cached 1-minute bars.
     Falls back to 0 on error or no data.
     """
     try:
-        api_key = _require_api_key()
-        ny = pytz.timezone("America/New_York")
+        return _sum_volume(get_day_minute_bars(ticker, trade_date))
+    except Exception:
+        return 0
 
-        start_dt = ny.localize(datetime.strptime(f"{trade_date} 04:00:00", "%Y-%m-%d %H:%M:%S"))
-        now_ny = _today_ny()
-        # If you're querying a past date intraday volume, cap at that day's 20:00 to avoid future bars
-        end_dt = now_ny if trade_date == now_ny.strftime("%Y-%m-%d") else ny.localize(
-            datetime.strptime(f"{trade_date} 20:00:00", "%Y-%m-%d %H:%M:%S")
-        )
 
-        start_ms = to_unix_ms(start_dt.astimezone(pytz.UTC))
-        end_ms = to_unix_ms(end_dt.astimezone(pytz.UTC))
+# ------------------------- grouped daily bars -------------------------
+def fetch_grouped_daily(date_str: str) -> Dict[str, Dict[str, float]]:
+    """
+    OHLCV for every US stock on one session in a single request.
+    Returns {ticker: {o,h,l,c,v}}; empty for non-trading days.
+    """
+    api_key = _require_api_key()
+    url = f"{BASE_URL}/v2/aggs/grouped/locale/us/market/stocks/{date_str}"
+    params = {"adjusted": "true", "apiKey": api_key}
 
-        url = f"{BASE_URL}/v2/aggs/ticker/{ticker}/range/1/minute/{start_ms}/{end_ms}"
-        params = {"adjusted": "true", "sort": "asc", "limit": 50000, "apiKey": api_key}
+    resp = _do_get(url, params)
+    results = _json(resp).get("results", []) or []
 
-        with _session() as s:
-            resp = s.get(url, params=params, timeout=HTTP_TIMEOUT)
-            resp.raise_for_status()
-            bars = resp.json().get("results", []) or []
+    return {
+        r["T"]: {"o": r.get("o"), "h": r.get("h"), "l": r.get("l"), "c": r.get("c"), "v": r.get("v")}
+        for r in results
+        if r.get("T")
+    }
 
-        return int(sum(int(bar.get("v", 0) or 0) for bar in bars))
-    except Exception:
-        return 0
+
+def prewarm_daily_cache(lookback: int = 20) -> None:
+    """
+    Load grouped daily bars for today plus the last `lookback` sessions into
+    _DAILY_BARS, so per-ticker daily lookups become dict reads.
+    Dates already cached are skipped unless stale (see _daily_bars_stale);
+    failed dates are simply left out.
+    """
+    dates = [d for d in (s.isoformat() for s in _recent_sessions(lookback + 1)) if _daily_bars_stale(d)]
+    if not dates:
+        return
+
+    with ThreadPoolExecutor(max_workers=ENRICH_WORKERS) as pool:
+        futures = {d: pool.submit(_throttled, fetch_grouped_daily, d) for d in dates}
+    fetched = (_today_key(), time.monotonic())
+    for d, fut in futures.items():
+        try:
+            _DAILY_BARS[d] = fut.result()
+        except Exception:
+            continue
+        _DAILY_BARS_FETCHED[d] = fetched
+
+
+def _daily_bars_stale(d: str) -> bool:
+    """
+    True if date `d` needs (re)fetching: not cached yet, or fetched while that
+    session was still open (partial or empty) more than INTRADAY_TTL ago.
+    Dates fetched after they ended are final.
+    """
+    if d not in _DAILY_BARS:
+        return True
+    fetched_on, fetched_at = _DAILY_BARS_FETCHED.get(d, (d, float("-inf")))
+    return fetched_on <= d and time.monotonic() - fetched_at > INTRADAY_TTL
+
+
+def _cached_daily_volumes(ticker: str, lookback: int) -> Optional[List[int]]:
+    """Volumes for the most recent `lookback` cached sessions of `ticker`, or None if the cache falls short."""
+    vols: List[int] = []
+    for d in sorted(_DAILY_BARS, reverse=True):
+        bar = _DAILY_BARS[d].get(ticker)
+        if bar is not None:
+            vols.append(int(bar.get("v") or 0))
+            if len(vols) == lookback:
+                return vols
+    return None
 
 
 # ------------------------ average daily volume ------------------------
+def _avg_volume_request(ticker: str, lookback: int) -> Tuple[str, Dict[str, Any]]:
+    # Exactly `lookback` sessions back (plus today's partial bar), not a calendar-day guess
+    end = _today_ny().date()
+    start = _nth_session_ago(lookback)
+    return _DAY_URL.format(ticker, start, end), _query(_require_api_key(), "desc", lookback)
+
+
+def _parse_avg_volume(bars, lookback: int) -> int:
+    """Mean volume of the first `lookback` bars (dicts or simdjson objects)."""
+    n = min(len(bars), lookback)
+    if not n:
+        return 0
+    # int64 truncates each bar like int() did, and keeps the sum exact
+    vols = np.fromiter((bars[i].get("v") or 0 for i in range(n)), dtype=np.float64, count=n).astype(np.int64)
+    return int(vols.sum() / n)
+
+
+@cached(ttl=DAILY_TTL, scope=_today_key)
+def _fetch_avg_daily_volume(ticker: str, lookback: int) -> int:
+    # Errors propagate (and aren't cached); get_avg_daily_volume turns them into 0
+    url, params = _avg_volume_request(ticker, lookback)
+
+    resp = _do_get(url, params)
+    bars = _ptr(_json_doc(resp), "/results") or []
+
+    return _parse_avg_volume(bars, lookback)
+
+
 def get_avg_daily_volume(ticker: str, lookback: int = 20) -> int:
     """
     Return average daily volume over the most recent `lookback` sessions.
+    Reads prewarmed grouped daily bars when they cover the window.
     Falls back to 0 on error or if no data.
     """
-    try:
-        api_key = _require_api_key()
-        end = datetime.utcnow().date()
-        start = end - timedelta(days=max(lookback * 3, 90))  # buffer for market-closed days
-
-        url = f"{BASE_URL}/v2/aggs/ticker/{ticker}/range/1/day/{start}/{end}"
-        params = {"adjusted": "true", "sort": "desc", "limit": lookback, "apiKey": api_key}
-
-        with _session() as s:
-            resp = s.get(url, params=params, timeout=HTTP_TIMEOUT)
-            resp.raise_for_status()
-            bars = resp.json().get("results", []) or []
+    vols = _cached_daily_volumes(ticker, lookback) if _DAILY_BARS else None
+    if vols:
+        return int(sum(vols) / len(vols))
 
-        if not bars:
-            return 0
-
-        vols = [int(bar.get("v", 0) or 0) for bar in bars[:lookback]]
-        return int(sum(vols) / len(vols)) if vols else 0
+    try:
+        return _fetch_avg_daily_volume(ticker, lookback)
     except Exception:
         return 0
 
 
 # --------------------------- 09:30 open price -------------------------
+def _parse_open_0930(bars: Dict[str, np.ndarray], trade_date: str) -> float:
+    # The first bar in 09:30:00-09:31:00 should be 09:30
+    t = bars["t"]
+    hits = np.flatnonzero((t >= _ny_ms(trade_date, "09:30:00")) & (t <= _ny_ms(trade_date, "09:31:00")))
+    if not hits.size:
+        return 0.0
+    return float(bars["o"][hits[0]])
+
+
 def get_open_price_0930(ticker: str, trade_date: str) -> float:
     """
-    Fetch the true 09:30:00 ET open price for `trade_date` using 1-min bars.
-    If the 09:30 bar is missing, returns 0.0.
+    Fetch the true 09:30:00 ET open price for `trade_date` from the day's
+    cached 1-min bars. If the 09:30 bar is missing, returns 0.0.
     """
-    api_key = _require_api_key()
-    ny = pytz.timezone("America/New_York")
+    return _parse_open_0930(get_day_minute_bars(ticker, trade_date), trade_date)
 
-    start_dt = ny.localize(datetime.strptime(f"{trade_date} 09:30:00", "%Y-%m-%d %H:%M:%S"))
-    end_dt = ny.localize(datetime.strptime(f"{trade_date} 09:31:00", "%Y-%m-%d %H:%M:%S"))
 
-    start_ms = to_unix_ms(start_dt.astimezone(pytz.UTC))
-    end_ms = to_unix_ms(end_dt.astimezone(pytz.UTC))
+# ------------------------------ caching -------------------------------
+def refresh() -> None:
+    """
+    Drop every memoised lookup (prev close, ATR, ADV, minute bars, grouped
+    daily bars). Call at session start so a long-lived process doesn't
+    serve yesterday's values.
+    """
+    get_previous_close.cache_clear()
+    _fetch_atr_14.cache_clear()
+    _fetch_avg_daily_volume.cache_clear()
+    _fetch_day_minute_bars.cache_clear()
+    _nyse_sessions.cache_clear()
+    _DAILY_BARS.clear()
+    _DAILY_BARS_FETCHED.clear()
 
-    url = f"{BASE_URL}/v2/aggs/ticker/{ticker}/range/1/minute/{start_ms}/{end_ms}"
-    params = {"adjusted": "true", "sort": "asc", "limit": 5, "apiKey": api_key}
 
-    with _session() as s:
-        resp = s.get(url, params=params, timeout=HTTP_TIMEOUT)
-        resp.raise_for_status()
-        bars = resp.json().get("results", []) or []
+# ------------------------- parallel enrichment ------------------------
+def _throttled(fn, *args, **kwargs):
+    """Run one adapter call while holding a request slot (keeps us under Polygon's rate limits)."""
+    with _REQUEST_SLOTS:
+        return fn(*args, **kwargs)
+
+
+def _minute_bar_metrics(ticker: str, trade_date: str) -> Dict[str, Any]:
+    """Premarket high + intraday volume in one task, so both read one cached minute-bar fetch."""
+    return {
+        "premarket_high": get_premarket_high(ticker, trade_date),
+        "intraday_volume": get_intraday_volume(ticker, trade_date),
+    }
+
+
+# What enrich_tickers reports for a lookup that raised (the getters' own fallbacks)
+_ENRICH_FALLBACKS: Dict[str, Any] = {
+    "prev_close": 0.0,
+    "minute_bars": {"premarket_high": 0.0, "intraday_volume": 0},
+    "atr_14": 1.0,
+    "avg_daily_volume": 0,
+}
 
-    if not bars:
-        return 0.0
 
-    # The first bar in this window should be 09:30
-    first_bar = bars[0]
-    return float(first_bar.get("o", 0.0) or 0.0)
+def _result_or_fallback(tkr: str, key: str, fut) -> Any:
+    try:
+        return fut.result()
+    except Exception as e:
+        # One ticker's failed request mustn't sink the rest of the batch
+        log.warning(f"{key} lookup failed for {tkr}: {e}")
+        return _ENRICH_FALLBACKS[key]
+
+
+def enrich_tickers(tickers: List[str], trade_date: str) -> List[Dict[str, Any]]:
+    """
+    Fetch prev close, premarket high, ATR(14), intraday and average daily volume
+    for every ticker concurrently over the shared Session.
+    Returns one dict per ticker, in input order; a lookup that fails is logged
+    and reported as its fallback value (see _ENRICH_FALLBACKS).
+    """
+    calls = (
+        ("prev_close", get_previous_close, ()),
+        ("minute_bars", _minute_bar_metrics, (trade_date,)),
+        ("atr_14", get_atr_14, (trade_date,)),
+        ("avg_daily_volume", get_avg_daily_volume, ()),
+    )
+    # Enough tickers that ~20 grouped calls beat one ADV call per ticker
+    if len(tickers) >= GROUPED_DAILY_MIN_TICKERS:
+        prewarm_daily_cache()
+
+    with ThreadPoolExecutor(max_workers=ENRICH_WORKERS) as pool:
+        futures = [
+            (tkr, [(key, pool.submit(_throttled, fn, tkr, *args)) for key, fn, args in calls])
+            for tkr in tickers
+        ]
+        rows = []
+        for tkr, pending in futures:
+            row = {"ticker": tkr, **{key: _result_or_fallback(tkr, key, fut) for key, fut in pending}}
+            row.update(row.pop("minute_bars"))
+            rows.append(row)
+        return rows
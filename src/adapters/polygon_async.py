@@ -0,0 +1,254 @@
+# -------------------------------------------------------------------
+# FILE: src/adapters/polygon_async.py
+# PURPOSE: asyncio counterparts of the polygon_adapter enrichment helpers
+#          (prev close, premarket high, ATR(14), intraday volume, ADV).
+# NOTES:
+#   - Request builders and result parsers are shared with polygon_adapter,
+#     so both paths return identical values and error fallbacks
+#   - One httpx.AsyncClient (HTTP/2 when `h2` is installed) per enrich_all call
+#   - 429/5xx are retried with backoff; a 429 pauses every coroutine (RateLimiter)
+# -------------------------------------------------------------------
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import List, Dict, Any, Optional
+
+import httpx
+
+from src.adapters import polygon_adapter as pa
+
+try:
+    import h2  # noqa: F401  (optional: httpx only speaks HTTP/2 with it installed)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+ASYNC_CONCURRENCY = 50  # in-flight requests per enrich_all call
+MAX_CONNECTIONS = 20
+
+# Same policy as the sync Session's urllib3 Retry
+RETRY_TOTAL = 5
+RETRY_BACKOFF = 0.5  # seconds; doubles per attempt
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RateLimiter:
+    """
+    Process-wide pacing shared by every async request:
+      - optional leaky bucket: at most `rate` requests/second (free tier plans)
+      - once Polygon says the budget is spent (429 / Retry-After /
+        X-RateLimit-Remaining: 0), all coroutines wait it out instead of
+        each hammering the API separately
+    """
+
+    def __init__(self, rate: Optional[float] = None) -> None:
+        self.rate = rate
+        self._resume_at = 0.0
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        now = time.monotonic()
+        start = self._resume_at
+        if self.rate:
+            # Claim the next free slot before sleeping so concurrent waiters queue up
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self.rate
+            start = max(start, slot)
+        delay = start - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def observe(self, resp: httpx.Response) -> None:
+        if resp.headers.get("X-RateLimit-Remaining") == "0":
+            self.pause(_retry_after(resp) or 1.0)
+
+
+# POLYGON_MAX_RPS caps request rate (e.g. 5 on the free tier); unset = no cap
+_LIMITER = RateLimiter(rate=float(os.getenv("POLYGON_MAX_RPS") or 0) or None)
+
+
+def _retry_after(resp: httpx.Response) -> Optional[float]:
+    try:
+        return float(resp.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+def make_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=_HTTP2,
+        limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS),
+        timeout=pa.HTTP_TIMEOUT,
+        headers={"User-Agent": "polygon-stock-tracker/1.0", "Accept-Encoding": pa.ACCEPT_ENCODING},
+    )
+
+
+async def _aget(client: httpx.AsyncClient, request) -> httpx.Response:
+    """GET with retries on 429/5xx and transport errors (exponential backoff, Retry-After honored)."""
+    url, params = request
+    for attempt in range(RETRY_TOTAL + 1):
+        await _LIMITER.wait()
+        backoff = RETRY_BACKOFF * (2 ** attempt)
+        try:
+            resp = await client.get(url, params=params)
+        except httpx.TransportError:
+            if attempt == RETRY_TOTAL:
+                raise
+            await asyncio.sleep(backoff)
+            continue
+        if resp.status_code in RETRY_STATUSES and attempt < RETRY_TOTAL:
+            delay = _retry_after(resp) or backoff
+            if resp.status_code == 429:
+                _LIMITER.pause(delay)  # rate limited: everyone backs off
+            else:
+                await asyncio.sleep(delay)
+            continue
+        _LIMITER.observe(resp)
+        resp.raise_for_status()
+        return resp
+
+
+async def _aget_results(client: httpx.AsyncClient, request) -> List[Dict[str, Any]]:
+    return pa._json(await _aget(client, request)).get("results", []) or []
+
+
+# ---------------------------- helpers --------------------------------
+async def aget_previous_close(client: httpx.AsyncClient, ticker: str) -> float:
+    return pa._parse_prev_close(pa._json_doc(await _aget(client, pa._prev_close_request(ticker))))
+
+
+async def aget_day_minute_bars(client: httpx.AsyncClient, ticker: str, date: str) -> Dict[str, Any]:
+    """04:00-20:00 ET (or now) 1-minute bars as column arrays; one fetch feeds premarket high, open and volume."""
+    return pa._bar_arrays(await _aget_results(client, pa._minute_bars_request(ticker, date, pa._day_end_ms(date))))
+
+
+async def aget_premarket_high(client: httpx.AsyncClient, ticker: str, date: str) -> float:
+    return pa._parse_premarket_high(await aget_day_minute_bars(client, ticker, date), date)
+
+
+async def aget_atr_14(client: httpx.AsyncClient, ticker: str, date: str) -> float:
+    try:
+        return pa._parse_atr(await _aget_results(client, pa._atr_request(ticker, date)))
+    except Exception:
+        return 1.0
+
+
+async def aget_intraday_volume(client: httpx.AsyncClient, ticker: str, date: str) -> int:
+    try:
+        return pa._sum_volume(await aget_day_minute_bars(client, ticker, date))
+    except Exception:
+        return 0
+
+
+async def aget_avg_daily_volume(client: httpx.AsyncClient, ticker: str, lookback: int = 20) -> int:
+    vols = pa._cached_daily_volumes(ticker, lookback) if pa._DAILY_BARS else None
+    if vols:
+        return int(sum(vols) / len(vols))
+    try:
+        return pa._parse_avg_volume(await _aget_results(client, pa._avg_volume_request(ticker, lookback)), lookback)
+    except Exception:
+        return 0
+
+
+async def aget_open_price_0930(client: httpx.AsyncClient, ticker: str, date: str) -> float:
+    return pa._parse_open_0930(await aget_day_minute_bars(client, ticker, date), date)
+
+
+async def aget_snapshot(client: httpx.AsyncClient, ticker: str) -> Dict[str, Any]:
+    resp = await _aget(client, (pa._SNAPSHOT_URL.format(ticker), {"apiKey": pa._require_api_key()}))
+    t = pa._ptr(pa._json_doc(resp), "/ticker")
+    return pa._snapshot_row(t) if t else {}
+
+
+# ---------------------------- snapshots ------------------------------
+_SNAPSHOTS_URL = f"{pa.BASE_URL}/v2/snapshot/locale/us/markets/stocks/tickers"
+
+
+async def afetch_snapshots(client: httpx.AsyncClient, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Async fetch_snapshots. Pages are chained through next_url, so they can't
+    be requested ahead of time; this just keeps the event loop free meanwhile.
+    """
+    api_key = pa._require_api_key()
+    url: Optional[str] = _SNAPSHOTS_URL
+    params: Optional[Dict[str, Any]] = {"apiKey": api_key}
+    if limit:
+        params["limit"] = limit
+    rows: List[Dict[str, Any]] = []
+    while url and not (limit and len(rows) >= limit):
+        doc = pa._json_doc(await _aget(client, (url, params)))
+        rows.extend(pa._snapshot_row(t) for t in (pa._ptr(doc, "/tickers") or []))
+        # httpx replaces (rather than merges) a URL's query when params are
+        # passed, so the key goes onto next_url itself to keep its cursor
+        next_url = pa._ptr(doc, "/next_url")
+        url = str(httpx.URL(next_url).copy_set_param("apiKey", api_key)) if next_url else None
+        params = None
+    return rows[:limit] if limit else rows
+
+
+async def afetch_snapshots_for(client: httpx.AsyncClient, tickers: List[str]) -> List[Dict[str, Any]]:
+    """Async fetch_snapshots_for: every SNAPSHOT_BATCH-sized `tickers=` request in flight at once."""
+    api_key = pa._require_api_key()
+
+    async def batch(chunk: List[str]) -> List[Dict[str, Any]]:
+        doc = pa._json_doc(await _aget(client, (_SNAPSHOTS_URL, {"tickers": ",".join(chunk), "apiKey": api_key})))
+        return [pa._snapshot_row(t) for t in (pa._ptr(doc, "/tickers") or [])]
+
+    step = pa.SNAPSHOT_BATCH
+    pages = await asyncio.gather(*(batch(tickers[i:i + step]) for i in range(0, len(tickers), step)))
+    return [row for page in pages for row in page]
+
+
+# ------------------------- async enrichment ---------------------------
+async def enrich_ticker(
+    client: httpx.AsyncClient,
+    ticker: str,
+    trade_date: str,
+    sem: Optional[asyncio.Semaphore] = None,
+) -> Dict[str, Any]:
+    """
+    All per-ticker metrics from four concurrent requests: prev close, ATR(14),
+    ADV, and one day of minute bars that feeds premarket high, 09:30 open and
+    intraday volume. `sem` bounds in-flight requests across tickers.
+    """
+    async def limited(coro):
+        if sem is None:
+            return await coro
+        async with sem:
+            return await coro
+
+    prev_close, day_bars, atr_14, avg_daily_volume = await asyncio.gather(
+        limited(aget_previous_close(client, ticker)),
+        limited(aget_day_minute_bars(client, ticker, trade_date)),
+        limited(aget_atr_14(client, ticker, trade_date)),
+        limited(aget_avg_daily_volume(client, ticker)),
+    )
+    return {
+        "ticker": ticker,
+        "prev_close": prev_close,
+        "premarket_high": pa._parse_premarket_high(day_bars, trade_date),
+        "open_0930": pa._parse_open_0930(day_bars, trade_date),
+        "atr_14": atr_14,
+        "intraday_volume": pa._sum_volume(day_bars),
+        "avg_daily_volume": avg_daily_volume,
+    }
+
+
+async def enrich_all(tickers: List[str], trade_date: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Async version of polygon_adapter.enrich_tickers (plus open_0930), in input order.
+    trade_date defaults to today (ET).
+    """
+    if trade_date is None:
+        trade_date = pa._today_key()
+    if len(tickers) >= pa.GROUPED_DAILY_MIN_TICKERS:
+        await asyncio.to_thread(pa.prewarm_daily_cache)
+
+    sem = asyncio.Semaphore(ASYNC_CONCURRENCY)
+    async with make_client() as client:
+        return list(await asyncio.gather(*(enrich_ticker(client, t, trade_date, sem) for t in tickers)))
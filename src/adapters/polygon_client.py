@@ -1,10 +1,28 @@
 # src/adapters/polygon_client.py
 import os
+import hashlib
+from datetime import datetime
+from urllib.parse import urlencode
+from zoneinfo import ZoneInfo
+
 import httpx
-from dotenv import load_dotenv
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-load_dotenv()  # read .env
+from src.adapters._cache import TTLCache
+from src.core.env import load as load_env
+
+try:
+    import h2  # noqa: F401  (optional: httpx only negotiates HTTP/2 with it installed)
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+try:
+    import orjson  # optional: faster decode of large snapshot/aggs payloads
+except ImportError:
+    orjson = None
+
+load_env()  # read .env (once per process)
 
 API_KEY = os.getenv("POLYGON_API_KEY")
 if not API_KEY:
@@ -12,12 +30,36 @@ if not API_KEY:
 
 BASE_URL = "https://api.polygon.io/v2"
 
+# Response cache TTLs (seconds): snapshots are 15m delayed anyway, today's bars
+# still grow, bars for a closed day never change
+SNAPSHOT_TTL = 10
+INTRADAY_TTL = 60
+CLOSED_DAY_TTL = 30 * 86400
+
+_NY_TZ = ZoneInfo("America/New_York")
+_CACHE = TTLCache("client_get")
+
+
+def _ttl_for(endpoint: str) -> float:
+    if endpoint.startswith("/snapshot/"):
+        return SNAPSHOT_TTL
+    if endpoint.startswith("/aggs/"):
+        to_date = endpoint.rsplit("/", 1)[-1]  # .../range/{m}/{span}/{from}/{to}
+        if to_date < datetime.now(_NY_TZ).date().isoformat():
+            return CLOSED_DAY_TTL
+    return INTRADAY_TTL
+
 
 class PolygonClient:
     def __init__(self, api_key: str = API_KEY, base_url: str = BASE_URL):
         self.api_key = api_key
         self.base_url = base_url
-        self.session = httpx.Client(timeout=10.0)
+        # One multiplexed HTTP/2 connection when h2 is installed; HTTP/1.1 keep-alive otherwise
+        self.session = httpx.Client(
+            http2=HTTP2,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=8))
     def _get(self, endpoint: str, params: dict = None):
@@ -27,18 +69,25 @@ class PolygonClient:
         url = f"{self.base_url}{endpoint}"
         r = self.session.get(url, params=params)
         r.raise_for_status()
-        return r.json()
+        return orjson.loads(r.content) if orjson is not None else r.json()
+
+    def _get_cached(self, endpoint: str, params: dict = None):
+        """_get through the shared TTL cache (Redis when configured); key excludes the API key."""
+        params = dict(params or {})
+        digest = hashlib.sha1((endpoint + "?" + urlencode(sorted(params.items()))).encode()).hexdigest()
+        return _CACHE.get_or_set(_CACHE.key(digest), _ttl_for(endpoint), lambda: self._get(endpoint, params))
 
     # --- Public methods ---
     def get_snapshot(self, ticker: str):
         """Get latest snapshot for a ticker (delayed 15m on Starter)."""
         endpoint = f"/snapshot/locale/us/markets/stocks/tickers/{ticker.upper()}"
-        data = self._get(endpoint)
+        data = self._get_cached(endpoint)
+        # `data` is the cached payload, shared with later hits: hand out copies
         return {
             "ticker": ticker.upper(),
-            "day": data["ticker"]["day"],
-            "minute": data["ticker"]["min"],
-            "prev_day": data["ticker"]["prevDay"],
+            "day": dict(data["ticker"]["day"]),
+            "minute": dict(data["ticker"]["min"]),
+            "prev_day": dict(data["ticker"]["prevDay"]),
             "todays_change": data["ticker"]["todaysChange"],
             "todays_change_pct": data["ticker"]["todaysChangePerc"],
             # provenance stamp
@@ -69,10 +118,12 @@ class PolygonClient:
             "sort": sort,
             "limit": limit,
         }
-        data = self._get(endpoint, params=params)
+        data = self._get_cached(endpoint, params=params)
+        # `data` is the cached payload, shared with later hits: callers get their
+        # own list of (flat) bar dicts to sort or edit
         return {
             "ticker": ticker.upper(),
-            "results": data.get("results", []),
+            "results": [dict(bar) for bar in data.get("results") or []],
             "count": data.get("resultsCount", 0),
             "status": data.get("status"),
             # provenance stamp
@@ -11,46 +11,84 @@ import os
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, List
-import pytz
+import numpy as np
+from zoneinfo import ZoneInfo
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from dotenv import load_dotenv
-load_dotenv(Path(__file__).resolve().parents[2] / ".env")
+from src.core.env import load as load_env
+load_env()
 
-from src.adapters.polygon_adapter import _require_api_key, _session, to_unix_ms
+from src.adapters.polygon_adapter import _do_get, _json, _require_api_key, to_unix_ms
+from src.adapters._cache import cached
 
 BASE_URL = "https://api.polygon.io"
-NY_TZ = pytz.timezone("America/New_York")
+NY_TZ = ZoneInfo("America/New_York")
 
+# Bars for a closed day never change; today's keep growing
+CLOSED_DAY_TTL = 30 * 86400
+INTRADAY_TTL = 60
 
-def get_intraday_bars(ticker: str, date: str, start_time: str = "09:30", end_time: str = "16:00") -> List[Dict]:
-    """
-    Fetch 1-minute bars for a ticker on a specific date.
-    Returns list of bars: [{t: timestamp_ms, o: open, h: high, l: low, c: close, v: volume}, ...]
-    """
-    api_key = _require_api_key()
+OPEN_MINUTE = 9 * 60 + 30  # 09:30 ET, minutes after midnight
+
+
+def _bars_ttl(ticker: str, date: str, *_) -> float:
+    return CLOSED_DAY_TTL if date < datetime.now(NY_TZ).strftime("%Y-%m-%d") else INTRADAY_TTL
+
+
+@lru_cache(maxsize=256)
+def _open_ms(date: str) -> int:
+    """09:30 ET on `date` as epoch ms; every other session time is a fixed offset from it."""
+    # fromisoformat is C-parsed and, unlike slicing, rejects malformed dates
+    return to_unix_ms(datetime.fromisoformat(f"{date}T09:30").replace(tzinfo=NY_TZ))
+
+
+def _ny_ms(date: str, hhmm: str) -> int:
+    """'HH:MM' ET on `date` as epoch ms (no DST switch happens after 03:00)."""
+    minutes = int(hhmm[0:2]) * 60 + int(hhmm[3:5]) - OPEN_MINUTE
+    return _open_ms(date) + minutes * 60_000
+
+
+def _ny_hhmm(ts_ms: int, open_ms: int) -> str:
+    """'HH:MM' ET of a bar timestamp on the session that opens at `open_ms`."""
+    minute = OPEN_MINUTE + (ts_ms - open_ms) // 60_000
+    return f"{minute // 60:02d}:{minute % 60:02d}"
 
-    # Build start/end datetime
-    start_dt = NY_TZ.localize(datetime.strptime(f"{date} {start_time}:00", "%Y-%m-%d %H:%M:%S"))
-    end_dt = NY_TZ.localize(datetime.strptime(f"{date} {end_time}:00", "%Y-%m-%d %H:%M:%S"))
 
-    start_ms = to_unix_ms(start_dt.astimezone(pytz.UTC))
-    end_ms = to_unix_ms(end_dt.astimezone(pytz.UTC))
+# Cached as Polygon's plain list of bar dicts so it can round-trip through Redis
+@cached(ttl=_bars_ttl)
+def _fetch_intraday_bars(ticker: str, date: str, start_time: str, end_time: str) -> List[Dict]:
+    api_key = _require_api_key()
+
+    start_ms = _ny_ms(date, start_time)
+    end_ms = _ny_ms(date, end_time)
 
     url = f"{BASE_URL}/v2/aggs/ticker/{ticker}/range/1/minute/{start_ms}/{end_ms}"
     params = {"adjusted": "true", "sort": "asc", "limit": 50000, "apiKey": api_key}
 
-    with _session() as s:
-        resp = s.get(url, params=params, timeout=30)
-        resp.raise_for_status()
-        data = resp.json()
+    # Same GET path as the adapters: shared Session, its retry policy, HTTP_TIMEOUT
+    data = _json(_do_get(url, params))
 
     return data.get("results", [])
 
 
+def get_intraday_bars(ticker: str, date: str, start_time: str = "09:30", end_time: str = "16:00") -> Dict[str, np.ndarray]:
+    """
+    Fetch 1-minute bars for a ticker on a specific date.
+    Returns column arrays, one entry per bar (ascending time):
+    {t: timestamp_ms (int64), o: open, h: high, l: low, c: close, v: volume (float64)}
+    """
+    raw = _fetch_intraday_bars(ticker, date, start_time, end_time)
+    n = len(raw)
+    return {
+        k: np.fromiter((b[k] for b in raw), dtype=np.int64 if k == "t" else np.float64, count=n)
+        for k in ("t", "o", "h", "l", "c", "v")
+    }
+
+
 def analyze_pd_behavior(
     ticker: str,
     date: str,
@@ -105,7 +143,7 @@ def analyze_pd_behavior(
     # Fetch 1-minute bars from 9:30-16:00
     bars = get_intraday_bars(ticker, date, "09:30", "16:00")
 
-    if not bars:
+    if not len(bars["t"]):
         return {
             'ticker': ticker,
             'date': date,
@@ -115,55 +153,57 @@ def analyze_pd_behavior(
     # Calculate premarket gap
     premarket_gap_pct = ((premarket_price - prev_close) / prev_close * 100.0) if prev_close else 0
 
+    # Session times as epoch ms, computed once per call
+    open_ms = _open_ms(date)
+    high_9_35_ms = open_ms + 5 * 60_000
+    pick_ms = _ny_ms(date, pick_time)
+
+    # Every reduction below is a vectorized op over the bar columns
+    t, h, l, c = bars["t"], bars["h"], bars["l"], bars["c"]
+    n = len(t)
+
     # Opening behavior (9:30-9:35)
-    open_9_30 = bars[0]['o'] if bars else 0
-    bars_9_35 = [b for b in bars if b['t'] <= to_unix_ms(NY_TZ.localize(datetime.strptime(f"{date} 09:35:00", "%Y-%m-%d %H:%M:%S")).astimezone(pytz.UTC))]
-    high_9_35 = max([b['h'] for b in bars_9_35]) if bars_9_35 else open_9_30
+    open_9_30 = float(bars["o"][0])
+    mask_9_35 = t <= high_9_35_ms
+    high_9_35 = float(h[mask_9_35].max()) if mask_9_35.any() else open_9_30
     spike_9_35_pct = ((high_9_35 - open_9_30) / open_9_30 * 100.0) if open_9_30 else 0
 
-    # Find peak (high of day)
-    high_bar = max(bars, key=lambda b: b['h'])
-    high_of_day = high_bar['h']
-    high_time_dt = datetime.fromtimestamp(high_bar['t'] / 1000, tz=pytz.UTC).astimezone(NY_TZ)
-    high_time = high_time_dt.strftime("%H:%M")
+    # Find peak (high of day); argmax keeps the first bar on ties, like max()
+    peak = int(h.argmax())
+    high_of_day = float(h[peak])
+    high_ts = int(t[peak])
+    high_time = _ny_hhmm(high_ts, open_ms)
 
     # Minutes to peak from 9:30
-    open_time = NY_TZ.localize(datetime.strptime(f"{date} 09:30:00", "%Y-%m-%d %H:%M:%S"))
-    minutes_to_peak = int((high_time_dt - open_time).total_seconds() / 60)
+    minutes_to_peak = int((high_ts - open_ms) / 60000)
 
-    # Price at pick time
-    pick_time_dt = NY_TZ.localize(datetime.strptime(f"{date} {pick_time}:00", "%Y-%m-%d %H:%M:%S"))
-    pick_time_ms = to_unix_ms(pick_time_dt.astimezone(pytz.UTC))
-    pick_bar = min([b for b in bars if b['t'] >= pick_time_ms], key=lambda b: abs(b['t'] - pick_time_ms), default=None)
-    price_at_pick = pick_bar['c'] if pick_bar else 0
+    # Price at pick time: first bar at/after pick_time (bars are sorted by t)
+    pick_idx = int(np.searchsorted(t, pick_ms, side="left"))
+    price_at_pick = float(c[pick_idx]) if pick_idx < n else 0
 
     pick_vs_open_pct = ((price_at_pick - open_9_30) / open_9_30 * 100.0) if open_9_30 else 0
     pick_vs_peak_pct = ((price_at_pick - high_of_day) / high_of_day * 100.0) if high_of_day else 0
 
-    # Fade analysis (when price drops X% from peak)
-    fade_10pct_threshold = high_of_day * 0.90
-    fade_20pct_threshold = high_of_day * 0.80
-
-    fade_10pct_time = None
-    fade_20pct_time = None
+    # Fade analysis (first bar after the peak whose low drops X% from it).
+    # One pass: the running low after the peak only falls, so a single
+    # searchsorted finds where it first crosses both thresholds.
+    post = np.flatnonzero(t > high_ts)
+    running_low = np.minimum.accumulate(l[post])
+    hit_10, hit_20 = np.searchsorted(-running_low, [-(high_of_day * 0.90), -(high_of_day * 0.80)], side="left")
+    fade_10 = int(t[post[hit_10]]) if hit_10 < post.size else None
+    fade_20 = int(t[post[hit_20]]) if hit_20 < post.size else None
 
-    for bar in bars:
-        if bar['t'] > high_bar['t']:  # After peak
-            if not fade_10pct_time and bar['l'] <= fade_10pct_threshold:
-                fade_dt = datetime.fromtimestamp(bar['t'] / 1000, tz=pytz.UTC).astimezone(NY_TZ)
-                fade_10pct_time = fade_dt.strftime("%H:%M")
-            if not fade_20pct_time and bar['l'] <= fade_20pct_threshold:
-                fade_dt = datetime.fromtimestamp(bar['t'] / 1000, tz=pytz.UTC).astimezone(NY_TZ)
-                fade_20pct_time = fade_dt.strftime("%H:%M")
+    fade_10pct_time = _ny_hhmm(fade_10, open_ms) if fade_10 is not None else None
+    fade_20pct_time = _ny_hhmm(fade_20, open_ms) if fade_20 is not None else None
 
     minutes_peak_to_fade = None
-    if fade_10pct_time:
-        fade_dt = datetime.strptime(f"{date} {fade_10pct_time}:00", "%Y-%m-%d %H:%M:%S")
-        fade_dt = NY_TZ.localize(fade_dt)
-        minutes_peak_to_fade = int((fade_dt - high_time_dt).total_seconds() / 60)
+    if fade_10 is not None:
+        # Fade time is reported to the minute, so measure from that minute
+        fade_minute_ms = fade_10 // 60000 * 60000
+        minutes_peak_to_fade = int((fade_minute_ms - high_ts) / 60000)
 
     # End of day
-    close_price = bars[-1]['c'] if bars else 0
+    close_price = float(c[-1])
     close_vs_peak_pct = ((close_price - high_of_day) / high_of_day * 100.0) if high_of_day else 0
 
     # Pattern classification
@@ -12,11 +12,45 @@ Usage:
   python -m src.analysis.scan_analyzer logs/scanner_2025-10-03.log
 """
 
+import mmap
+import os
 import re
 from datetime import datetime
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
+
+try:
+    import hyperscan  # optional: DFA prefilter for very large logs
+except ImportError:
+    hyperscan = None
+
+# Top 5 log line, matched against the raw (mmapped) bytes at line starts:
+#   2025-10-03 09:45:12,345 [INFO]    ABCD: score=92.1 gap=+35.2% last=4.12 prev=3.05 vol=12.3M
+# [^\S\n] is \s without newlines, so a match never spans two lines.
+# Groups: 1=timestamp 2=ticker 3=score 4=gap 5=last 6=prev 7=vol 8=vol unit
+_PATTERN = re.compile(
+    rb'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ \[INFO\][^\S\n]+(\w+): score=(\d+\.\d+) gap=([+-]?\d+\.\d+)% '
+    rb'last=(\d+\.\d+) prev=(\d+\.\d+) vol=([\d.]+)([KM]?)',
+    re.MULTILINE,
+)
+_VOLUME_UNITS = {b'M': 1_000_000, b'K': 1_000, b'': 1}
+
+# Hyperscan has no capture groups, so it only finds where candidate lines
+# start; _PATTERN then extracts the fields from just those lines.
+_HS_PREFIX = rb'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d+ \[INFO\][^\S\n]+\w+: score='
+_HS_DB = None
+
+
+def _hs_db():
+    global _HS_DB
+    if _HS_DB is None:
+        db = hyperscan.Database()
+        db.compile(expressions=[_HS_PREFIX], ids=[0], elements=1,
+                   flags=[hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SOM_LEFTMOST])
+        _HS_DB = db
+    return _HS_DB
+
 
 class ScanAnalyzer:
     """Analyze scanner log files to extract insights"""
@@ -25,48 +59,79 @@ class ScanAnalyzer:
         self.log_path = Path(log_path)
         self.scan_history = defaultdict(list)  # {ticker: [(time, score, gap, price, vol), ...]}
         self.top5_appearances = defaultdict(int)  # {ticker: count}
+        # Maintained while parsing so lookups don't rescan history
+        self.first = {}  # {ticker: first scan}
+        self.peak = {}  # {ticker: (price, time)}
+
+    def _matches(self) -> Iterator["re.Match[bytes]"]:
+        """Top 5 line matches over the raw log bytes (Hyperscan narrows the search when installed)."""
+        if hyperscan is None:
+            # Binary mode skips decoding every line
+            with open(self.log_path, 'rb', buffering=1 << 20) as f:
+                for line in f:
+                    # Cheap substring check before touching the regex engine
+                    if b"score=" not in line:
+                        continue
+                    match = _PATTERN.match(line)
+                    if match:
+                        yield match
+            return
+
+        # mmap of empty files isn't allowed
+        if os.path.getsize(self.log_path) == 0:
+            return
+        with open(self.log_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            starts = []
+
+            def on_match(_id, start, _end, _flags, _ctx):
+                if not starts or starts[-1] != start:
+                    starts.append(start)
+
+            _hs_db().scan(buf, match_event_handler=on_match)
+            for start in starts:
+                match = _PATTERN.match(buf, start)
+                if match:
+                    yield match
 
     def parse_log(self):
         """Extract Top 5 entries from scanner log"""
-        pattern = r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ \[INFO\]\s+(\w+): score=(\d+\.\d+) gap=([+-]?\d+\.\d+)% last=(\d+\.\d+) prev=(\d+\.\d+) vol=([\d.]+[KM]?)'
-
-        with open(self.log_path, 'r') as f:
-            for line in f:
-                match = re.search(pattern, line)
-                if match:
-                    timestamp_str, ticker, score, gap, last, prev, vol = match.groups()
-                    timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-
-                    # Parse volume (convert K/M to numbers)
-                    vol_num = float(vol.replace('M', '').replace('K', ''))
-                    if 'M' in vol:
-                        vol_num *= 1_000_000
-                    elif 'K' in vol:
-                        vol_num *= 1_000
-
-                    self.scan_history[ticker].append({
-                        'time': timestamp,
-                        'score': float(score),
-                        'gap': float(gap),
-                        'price': float(last),
-                        'prev': float(prev),
-                        'volume': vol_num
-                    })
-                    self.top5_appearances[ticker] += 1
+        # Bytes in, bytes out: only the ticker gets decoded
+        for match in self._matches():
+            ts, raw_ticker, score, gap, last, prev, vol, unit = match.groups()
+            ticker = raw_ticker.decode('ascii')
+            # Fixed-width timestamp: slicing beats strptime
+            timestamp = datetime(int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                                 int(ts[11:13]), int(ts[14:16]), int(ts[17:19]))
+
+            # Volume unit is its own group (K/M or none)
+            vol_num = float(vol) * _VOLUME_UNITS[unit]
+
+            price = float(last)
+            scan = {
+                'time': timestamp,
+                'score': float(score),
+                'gap': float(gap),
+                'price': price,
+                'prev': float(prev),
+                'volume': vol_num
+            }
+            self.scan_history[ticker].append(scan)
+            self.top5_appearances[ticker] += 1
+
+            if ticker not in self.first:
+                self.first[ticker] = scan
+            # Strict > keeps the earliest scan at the peak price
+            peak = self.peak.get(ticker)
+            if peak is None or price > peak[0]:
+                self.peak[ticker] = (price, timestamp)
 
     def get_first_appearance(self, ticker: str) -> Dict:
         """Get when ticker first appeared in Top 5"""
-        if ticker in self.scan_history:
-            return self.scan_history[ticker][0]
-        return None
+        return self.first.get(ticker)
 
     def get_peak_price(self, ticker: str) -> Tuple[float, datetime]:
         """Get highest price and when it occurred"""
-        if ticker not in self.scan_history:
-            return None, None
-
-        peak = max(self.scan_history[ticker], key=lambda x: x['price'])
-        return peak['price'], peak['time']
+        return self.peak.get(ticker, (None, None))
 
     def analyze_ticker(self, ticker: str):
         """Full analysis of a specific ticker's scanner activity"""
@@ -74,7 +139,7 @@ class ScanAnalyzer:
             return f"{ticker}: Not found in scanner history"
 
         history = self.scan_history[ticker]
-        first = history[0]
+        first = self.first[ticker]
         peak_price, peak_time = self.get_peak_price(ticker)
 
         report = f"""
@@ -100,9 +165,9 @@ class ScanAnalyzer:
     def find_best_performers(self, min_gain: float = 10.0) -> List[str]:
         """Find tickers that gained min_gain% from first appearance to peak"""
         performers = []
-        for ticker in self.scan_history:
-            first_price = self.scan_history[ticker][0]['price']
-            peak_price, _ = self.get_peak_price(ticker)
+        for ticker, first in self.first.items():
+            first_price = first['price']
+            peak_price, _ = self.peak[ticker]
             gain_pct = ((peak_price - first_price) / first_price) * 100
 
             if gain_pct >= min_gain:
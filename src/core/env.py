@@ -0,0 +1,22 @@
+# -------------------------------------------------------------------
+# FILE: src/core/env.py
+# PURPOSE: Load the project .env once per process.
+# NOTES:
+#   - Every module that needs env vars calls load(); only the first call
+#     touches the filesystem, later ones return the cached os.environ
+#   - Variables already set in the environment win over .env
+# -------------------------------------------------------------------
+import os
+from functools import lru_cache
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+ROOT = Path(__file__).resolve().parents[2]
+ENV_PATH = ROOT / ".env"
+
+
+@lru_cache(maxsize=1)
+def load() -> "os._Environ[str]":
+    load_dotenv(ENV_PATH)
+    return os.environ
@@ -0,0 +1,122 @@
+# -------------------------------------------------------------------
+# FILE: src/core/io_writer.py
+# PURPOSE: Background appends for the scanner's CSV outputs.
+# NOTES:
+#   - Callers enqueue pre-rendered text and return immediately; one worker
+#     thread does the file I/O, so a slow output dir never stalls a scan tick
+#   - The worker drains everything queued, coalesces it per file and appends
+#     each file's batch with a single write (see output.append_with_header)
+#   - One worker keeps appends to a file in submission order
+#   - Queue is bounded: a stuck disk applies backpressure instead of growing memory
+#   - flush() waits for queued writes; close() runs at interpreter exit
+#   - If the worker can't run (stopped, or threads unavailable at shutdown)
+#     writes happen inline, as before
+# -------------------------------------------------------------------
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+QUEUE_MAXSIZE = 1024
+
+log = logging.getLogger(__name__)
+
+# append(path, header_line, body, probe) -> None
+AppendFn = Callable[[Any, str, str, Callable[[str], bool]], None]
+
+_STOP = object()
+
+
+class AsyncCSVWriter:
+    """Queue of header-aware CSV appends, written by one daemon thread."""
+
+    def __init__(self, append: AppendFn, maxsize: int = QUEUE_MAXSIZE) -> None:
+        self._append = append
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, path, header_line: str, body: str, probe: Callable[[str], bool]) -> None:
+        """Queue body for path (header_line is written first if probe says the file lacks it)."""
+        if self._closed or not self._start():
+            self._append(path, header_line, body, probe)
+            return
+        self._queue.put((path, header_line, body, probe))
+
+    def flush(self) -> None:
+        """Block until everything submitted so far is on disk."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write out the queue and stop the worker; later submits write inline."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join()
+
+    def _start(self) -> bool:
+        if self._thread is not None:
+            return True
+        with self._lock:
+            if self._thread is None and not self._closed:
+                thread = threading.Thread(target=self._run, name="csv-writer", daemon=True)
+                try:
+                    thread.start()
+                except RuntimeError:  # e.g. interpreter shutting down
+                    return False
+                self._thread = thread
+        return self._thread is not None
+
+    def _run(self) -> None:
+        while True:
+            jobs = [self._queue.get()]
+            # Everything else already queued goes out in this same batch
+            while True:
+                try:
+                    jobs.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(job is _STOP for job in jobs)
+            self._write_batch([job for job in jobs if job is not _STOP])
+            for _ in jobs:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, jobs: List[Tuple[Any, str, str, Callable[[str], bool]]]) -> None:
+        # (path, header_line, probe) -> bodies, first-submitted order kept
+        batches: Dict[Tuple[Any, str, Callable[[str], bool]], List[str]] = {}
+        for path, header_line, body, probe in jobs:
+            batches.setdefault((path, header_line, probe), []).append(body)
+
+        for (path, header_line, probe), bodies in batches.items():
+            try:
+                self._append(path, header_line, "".join(bodies), probe)
+            except Exception as e:
+                log.error(f"CSV append to {path} failed: {e}")
+
+
+_WRITERS: Dict[AppendFn, AsyncCSVWriter] = {}
+_WRITERS_LOCK = threading.Lock()
+
+
+def get_writer(append: AppendFn) -> AsyncCSVWriter:
+    """Process-wide writer for `append` (created on first use, closed at exit)."""
+    writer = _WRITERS.get(append)
+    if writer is None:
+        with _WRITERS_LOCK:
+            writer = _WRITERS.get(append)
+            if writer is None:
+                writer = _WRITERS[append] = AsyncCSVWriter(append)
+                atexit.register(writer.close)
+    return writer
@@ -1,11 +1,21 @@
 import csv, os
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable, List
+
+from src.core.output import csv_cell
 
 JOURNAL_HEADERS = [
     "date","ticker","side","entry_price","exit_price","shares",
     "total_cost","pl_dollar","pl_percent","plan","actual","notes"
 ]
+JOURNAL_BUFFER = 1 << 16  # bytes buffered before hitting the file
+
+# Fixed schema, so each row is one str.format; output is byte-for-byte what
+# csv.DictWriter writes (excel dialect: minimal quoting, \r\n line endings)
+_ROW_FMT = ",".join("{%s}" % h for h in JOURNAL_HEADERS) + "\r\n"
+
+def _format_row(row: Dict) -> str:
+    return _ROW_FMT.format_map({k: csv_cell(v) for k, v in row.items()})
 
 def ensure_file(path: str):
     os.makedirs(os.path.dirname(path), exist_ok=True)
@@ -19,25 +29,19 @@ def compute_pl(entry_price: float, exit_price: float, shares: int):
     pl_percent = round(((exit_price - entry_price) / entry_price) * 100, 2) if entry_price else 0.0
     return total_cost, pl_dollar, pl_percent
 
-def record_trade(path: str, *,
-                 date: Optional[str] = None,
-                 ticker: str,
-                 side: str,
-                 entry_price: float,
-                 exit_price: float,
-                 shares: int,
-                 plan: str = "",
-                 actual: str = "",
-                 notes: str = ""):
-    """
-    side: 'long' or 'short'
-    date: ISO yyyy-mm-dd (default: today)
-    """
-    ensure_file(path)
+def _trade_row(*,
+               date: Optional[str] = None,
+               ticker: str,
+               side: str,
+               entry_price: float,
+               exit_price: float,
+               shares: int,
+               plan: str = "",
+               actual: str = "",
+               notes: str = "") -> Dict:
     date = date or datetime.today().date().isoformat()
     total_cost, pl_dollar, pl_percent = compute_pl(entry_price, exit_price, shares)
-
-    row = {
+    return {
         "date": date,
         "ticker": ticker.upper(),
         "side": side,
@@ -51,6 +55,75 @@ def record_trade(path: str, *,
         "actual": actual,
         "notes": notes,
     }
-    with open(path, "a", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=JOURNAL_HEADERS)
-        w.writerow(row)
+
+class JournalWriter:
+    """
+    Keeps the journal open (and buffered) across several trades:
+
+        with JournalWriter(path) as j:
+            j.record(ticker="ABC", side="long", entry_price=1.0, exit_price=1.2, shares=100)
+
+    Long-lived callers can skip the `with` and call close() when done;
+    rows are buffered in memory until flush()/close().
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._f = None
+
+    def _open(self):
+        if self._f is None:
+            ensure_file(self.path)
+            self._f = open(self.path, "a", newline="", buffering=JOURNAL_BUFFER)
+        return self._f
+
+    def __enter__(self) -> "JournalWriter":
+        self._open()
+        return self
+
+    def record(self, **trade):
+        """Same keyword arguments as record_trade (minus path)."""
+        self._open().write(_format_row(_trade_row(**trade)))
+
+    def record_many(self, trades: Iterable[Dict]):
+        self._open().write("".join(_format_row(_trade_row(**t)) for t in trades))
+
+    def flush(self):
+        if self._f is not None:
+            self._f.flush()
+
+    def close(self):
+        if self._f is None:
+            return
+        self._f.close()
+        self._f = None
+        # journal.feather is now stale; readers rebuild it on demand
+        # (see output.fresh_feather_sidecar) rather than every append paying O(file)
+
+    def __exit__(self, *exc):
+        self.close()
+
+def record_trades_batch(path: str, trades: List[Dict]):
+    """
+    Append several trades with one open/close of the journal.
+    Each dict takes the keyword arguments of record_trade.
+    """
+    with JournalWriter(path) as j:
+        j.record_many(trades)
+
+def record_trade(path: str, *,
+                 date: Optional[str] = None,
+                 ticker: str,
+                 side: str,
+                 entry_price: float,
+                 exit_price: float,
+                 shares: int,
+                 plan: str = "",
+                 actual: str = "",
+                 notes: str = ""):
+    """
+    side: 'long' or 'short'
+    date: ISO yyyy-mm-dd (default: today)
+    """
+    with JournalWriter(path) as j:
+        j.record(date=date, ticker=ticker, side=side, entry_price=entry_price,
+                 exit_price=exit_price, shares=shares, plan=plan, actual=actual, notes=notes)
@@ -3,53 +3,150 @@ from __future__ import annotations   # <-- must be first
 ## -------------------------------------------------------------------
 ## Imports
 ## -------------------------------------------------------------------
-import csv
 import os
 from datetime import datetime
-from typing import Any, Dict, Iterable, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 from pathlib import Path
 
+from src.core.io_writer import get_writer
+
+try:
+    import pyarrow  # noqa: F401  (optional; pandas needs it for Feather)
+except ImportError:
+    pyarrow = None
+
+## -------------------------------------------------------------------
+## CSV rendering + single-write append
+##  - Lines are byte-for-byte what csv.DictWriter writes
+##    (excel dialect: minimal quoting, \r\n line endings)
+##  - A whole batch goes to disk in one os.write on an O_APPEND fd
+## -------------------------------------------------------------------
+def csv_cell(v: Any) -> str:
+    if v is None:
+        return ""
+    if isinstance(v, str):
+        if "," in v or '"' in v or "\n" in v or "\r" in v:
+            return '"' + v.replace('"', '""') + '"'
+        return v
+    # csv formats floats (numpy float64 included) with float repr, the rest with str()
+    return float.__repr__(v) if isinstance(v, float) else str(v)
+
+def csv_line(values: Iterable[Any]) -> str:
+    return ",".join(map(csv_cell, values)) + "\r\n"
+
+def append_text(path, payload: str, create: bool = True) -> None:
+    """
+    Append payload with one write syscall (looping only on a short write).
+    create=False raises FileNotFoundError instead of creating a missing file.
+    """
+    data = memoryview(payload.encode("utf-8"))
+    flags = os.O_WRONLY | os.O_APPEND | (os.O_CREAT if create else 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+## -------------------------------------------------------------------
+## Header-aware append
+##  - Whether a CSV already starts with its header is probed once per file
+##    per process, then remembered (_HEADER_WRITTEN, keyed by abspath, holding
+##    the (st_dev, st_ino) of the file that was probed)
+##  - A file that vanished (cleanup) is recreated with a header; one replaced
+##    by a different file (rotation) or truncated to empty is probed again
+## -------------------------------------------------------------------
+_HEADER_WRITTEN: Dict[str, Tuple[int, int]] = {}
+
+def append_with_header(path, header_line: str, body: str, probe: Callable[[str], bool]) -> None:
+    """Append body, prefixed by header_line unless probe(path) (cached per file) says it's there."""
+    key = os.path.abspath(path)
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
+        st = None
+
+    if st is not None and st.st_size > 0:
+        ident = (st.st_dev, st.st_ino)
+        if _HEADER_WRITTEN.get(key) == ident or probe(key):
+            try:
+                append_text(key, body, create=False)
+                _HEADER_WRITTEN[key] = ident
+                return
+            except FileNotFoundError:
+                pass  # removed since the stat: start a fresh file below
+
+    _HEADER_WRITTEN.pop(key, None)
+    append_text(key, header_line + body)
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
+        return  # gone again already; the next append re-checks
+    _HEADER_WRITTEN[key] = (st.st_dev, st.st_ino)
+
+def append_with_header_async(path, header_line: str, body: str, probe: Callable[[str], bool]) -> None:
+    """append_with_header on the background CSV writer; returns before the write happens."""
+    get_writer(append_with_header).submit(path, header_line, body, probe)
+
+def flush_writes() -> None:
+    """Wait for queued append_with_header_async writes to reach disk."""
+    get_writer(append_with_header).flush()
+
 ## -------------------------------------------------------------------
 ## Utility: Normalize Mover Input
 ##  - Converts different shapes (dict, tuple, list) into a standard dict
 ##  - Standard form: {"ticker": str, "gap_pct": float, "volume": int}
+##  - gap/volume aliases resolve by presence (_first): a 0 / 0.0 gap is kept,
+##    where the old `a or b or c` chains treated it as missing and dropped
+##    the mover (and skipped a 0 volume for the next alias)
 ## -------------------------------------------------------------------
+_GAP_KEYS = ("gap_pct", "gap", "percent")
+_VOL_KEYS = ("volume", "vol")
+
+def _first(d: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """First value among keys that is present and not None (0 / 0.0 count as values)."""
+    for k in keys:
+        v = d.get(k)
+        if v is not None:
+            return v
+    return None
+
 def _normalize_mover(m: Any) -> Optional[Dict[str, Any]]:
     """
     Accepts a mover in several shapes and normalizes to:
     {"ticker": str, "gap_pct": float, "volume": int}
     Returns None if it can't be normalized.
     """
-    # Case 1: already a dict
-    if isinstance(m, dict):
-        ticker = m.get("ticker") or m.get("symbol")
-        gap = m.get("gap_pct") or m.get("gap") or m.get("percent")
-        vol = m.get("volume") or m.get("vol") or 0
-        if ticker is not None and gap is not None:
+    match m:
+        # Case 1: already a dict
+        case dict():
+            # A blank ticker isn't one: "" falls back to symbol, as it always has
+            ticker = m.get("ticker") or m.get("symbol")
+            gap = _first(m, _GAP_KEYS)
+            if ticker is None or gap is None:
+                return None
+            vol = _first(m, _VOL_KEYS)
             return {"ticker": str(ticker), "gap_pct": float(gap), "volume": int(vol or 0)}
-        return None
 
-    # Case 2: tuple/list variants
-    if isinstance(m, (tuple, list)):
+        # Case 2: tuple/list variants
         # ("TICKER", {"gap_pct": ..., "volume": ...})
-        if len(m) >= 2 and isinstance(m[0], str) and isinstance(m[1], dict):
-            d = m[1]
-            gap = d.get("gap_pct") or d.get("gap") or d.get("percent")
-            vol = d.get("volume") or d.get("vol") or 0
+        case [str() as ticker, dict() as d, *_]:
+            gap = _first(d, _GAP_KEYS)
             if gap is not None:
-                return {"ticker": m[0], "gap_pct": float(gap), "volume": int(vol or 0)}
+                return {"ticker": ticker, "gap_pct": float(gap), "volume": int(_first(d, _VOL_KEYS) or 0)}
             return None
 
-        # ("TICKER", 292.12 [, 123456])
-        if len(m) >= 2 and isinstance(m[0], str) and isinstance(m[1], (int, float)):
-            ticker = m[0]
-            gap = float(m[1])
-            vol = int(m[2]) if len(m) >= 3 and isinstance(m[2], (int, float)) else 0
-            return {"ticker": ticker, "gap_pct": gap, "volume": vol}
+        # ("TICKER", 292.12, 123456)
+        case [str() as ticker, int() | float() as gap, int() | float() as vol, *_]:
+            return {"ticker": ticker, "gap_pct": float(gap), "volume": int(vol)}
+
+        # ("TICKER", 292.12 [, non-numeric])
+        case [str() as ticker, int() | float() as gap, *_]:
+            return {"ticker": ticker, "gap_pct": float(gap), "volume": 0}
 
         # ({...},) weird cases
-        if len(m) >= 1 and isinstance(m[0], dict):
-            return _normalize_mover(m[0])
+        case [dict() as d, *_]:
+            return _normalize_mover(d)
 
     # Unknown shape
     return None
@@ -65,56 +162,51 @@ def write_watchlist(path: str, movers: Iterable[Any], targets=None) -> None:
     - Accepts movers as dicts OR tuples.
     - Deduplicates by ticker (last occurrence in the batch wins).
     - Appends to file; writes header if file doesn't exist.
+    - The append runs on the background writer (flush_writes() to wait for it).
     """
     os.makedirs(os.path.dirname(path), exist_ok=True)
 
-    today = datetime.now().strftime("%Y-%m-%d")
-    now_ts = datetime.now().strftime("%H:%M:%S")
-
-    # Normalize & dedupe
-    seen: Dict[str, Dict[str, Any]] = {}
-    for m in movers:
-        nm = _normalize_mover(m)
-        if not nm:
-            continue
-        # Skip rows with missing/absurd gap_pct
-        gap = nm.get("gap_pct")
-        if gap is None:
-            continue
-        # You can tighten these guards if needed
-        if gap <= -99.9 or gap >= 1000:
-            continue
-        seen[nm["ticker"]] = nm  # last wins
+    now = datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    now_ts = now.strftime("%H:%M:%S")
+
+    # Normalize, skipping rows with missing/absurd gap_pct
+    # (you can tighten these guards if needed)
+    normalized = [
+        nm for m in movers
+        if (nm := _normalize_mover(m)) and not (nm["gap_pct"] <= -99.9 or nm["gap_pct"] >= 1000)
+    ]
+    # Dedupe by ticker: last wins, first-seen order kept
+    seen: Dict[str, Dict[str, Any]] = {nm["ticker"]: nm for nm in normalized}
 
     # Nothing to write
     if not seen:
         return
 
-    rows = []
-    for tkr, r in seen.items():
-        rows.append({
-            "date": today,
-            "ticker": tkr,
-            "gap_pct": round(float(r.get("gap_pct", 0.0)), 2),
-            "volume": int(r.get("volume", 0) or 0),
-            "timestamp": now_ts
-        })
+    # Whole batch rendered up front, in header order
+    lines = [
+        csv_line((
+            today,
+            tkr,
+            round(float(r.get("gap_pct", 0.0)), 2),
+            int(r.get("volume", 0) or 0),
+            now_ts,
+        ))
+        for tkr, r in seen.items()
+    ]
 
     header = ["date", "ticker", "gap_pct", "volume", "timestamp"]
 
-    # Detect existing header
+    append_with_header_async(path, csv_line(header), "".join(lines), _starts_with_date_header)
+
+def _starts_with_date_header(path: str) -> bool:
+    """Detect existing header"""
     try:
         with open(path, "r") as f:
             first_line = f.readline().strip()
-            has_header = first_line.lower().startswith("date,")
+            return first_line.lower().startswith("date,")
     except FileNotFoundError:
-        has_header = False
-
-    with open(path, "a", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=header)
-        if not has_header:
-            writer.writeheader()
-        writer.writerows(rows)
+        return False
 
 ## -------------------------------------------------------------------
 ## Final Pick CSV Writer (append to src/core/output.py)
@@ -137,14 +229,47 @@ FINAL_PICK_HEADERS = [
 def write_final_pick(row: Dict[str, object], path: str = "output/final_pick.csv") -> None:
     """
     Appends one row (dict) to output/final_pick.csv, creating it with headers if missing.
+    Written in the background like write_watchlist.
     """
     outfile = Path(path)
     outfile.parent.mkdir(parents=True, exist_ok=True)
 
-    file_exists = outfile.exists()
-    with outfile.open("a", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=FINAL_PICK_HEADERS)
-        if not file_exists:
-            writer.writeheader()
-        sanitized = {k: row.get(k, "") for k in FINAL_PICK_HEADERS}
-        writer.writerow(sanitized)
+    body = csv_line(row.get(k, "") for k in FINAL_PICK_HEADERS)
+    append_with_header_async(outfile, csv_line(FINAL_PICK_HEADERS), body, os.path.exists)
+
+## -------------------------------------------------------------------
+## Feather sidecars (machine-readable copy written next to a CSV)
+##  - CSV stays the human/editable source of truth
+##  - Readers only use the sidecar when it is at least as new as the CSV;
+##    appenders (journal) leave it stale and the next reader rebuilds it
+##  - No-ops when pyarrow isn't installed
+## -------------------------------------------------------------------
+def feather_path(csv_path) -> Path:
+    return Path(csv_path).with_suffix(".feather")
+
+def write_feather_sidecar(csv_path, frame=None) -> None:
+    """
+    Rewrite <name>.feather from <name>.csv (uncompressed for fastest reads).
+    `frame` is a DataFrame the caller already parsed from the CSV, saving a re-read.
+    """
+    if pyarrow is None:
+        return
+    import pandas as pd
+    if frame is None:
+        try:
+            frame = pd.read_csv(csv_path)
+        except (FileNotFoundError, pd.errors.EmptyDataError):
+            return
+    frame.to_feather(feather_path(csv_path), compression="uncompressed")
+
+def fresh_feather_sidecar(csv_path) -> Optional[Path]:
+    """The sidecar path if it exists and is not older than the CSV, else None."""
+    if pyarrow is None:
+        return None
+    fp = feather_path(csv_path)
+    try:
+        if fp.stat().st_mtime >= Path(csv_path).stat().st_mtime:
+            return fp
+    except FileNotFoundError:
+        pass
+    return None
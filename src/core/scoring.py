@@ -4,12 +4,12 @@ from __future__ import annotations
 ## Imports
 ## -------------------------------------------------------------------
 from dataclasses import dataclass
-from typing import Dict, List, Iterable, Optional
+from typing import Dict, List, Iterable, NamedTuple, Optional, Tuple
 from datetime import datetime, time
 from zoneinfo import ZoneInfo
 import math
 import logging
-import pytz
+import numpy as np
 
 NY = ZoneInfo("America/New_York")
 
@@ -33,6 +33,27 @@ class Candidate:
     rvol: Optional[float] = None
     atr_stretch: Optional[float] = None
 
+    @classmethod
+    def to_soa(cls, cands: List["Candidate"]) -> "CandidateArrays":
+        """Candidates as parallel columns (structure of arrays) for vectorized scoring."""
+        cols = {
+            name: np.array([getattr(c, name) for c in cands], dtype=np.float64)
+            for name in CandidateArrays._fields if name != "has_catalyst"
+        }
+        return CandidateArrays(
+            has_catalyst=np.array([bool(c.has_catalyst) for c in cands], dtype=bool), **cols
+        )
+
+class CandidateArrays(NamedTuple):
+    """Candidate fields as NumPy columns; attribute names match Candidate's."""
+    last_price: np.ndarray
+    prev_close: np.ndarray
+    premarket_high: np.ndarray
+    intraday_volume: np.ndarray
+    avg_daily_volume: np.ndarray
+    atr_14: np.ndarray
+    has_catalyst: np.ndarray
+
 ## -------------------------------------------------------------------
 ## Time / Helper Functions
 ## -------------------------------------------------------------------
@@ -62,9 +83,9 @@ def compute_atr_stretch(current_price: float, prev_close: float, atr_value: floa
 ## -------------------------------------------------------------------
 ## Filters + Scoring
 ## -------------------------------------------------------------------
-def passes_filters(c: Candidate, min_liquidity: int) -> bool:
-    """Final-pick pre-filters: time, above PMH, liquidity."""
-    if not is_after_935_et():
+def passes_filters(c: Candidate, min_liquidity: int, *, after935: Optional[bool] = None) -> bool:
+    """Final-pick pre-filters: time, above PMH, liquidity. Pass after935 to skip the clock read."""
+    if not (is_after_935_et() if after935 is None else after935):
         return False
     if c.last_price <= c.premarket_high:  # must be trading above PMH
         return False
@@ -106,20 +127,75 @@ def calculate_final_score(
         catalyst_score * weights.get("catalyst", 0.1)
     )
 
+class Weights(NamedTuple):
+    """calculate_final_score's weights, resolved once (defaults filled in)."""
+    gap: float
+    rvol: float
+    atr: float
+    cat: float
+    thr: float   # ATR stretch threshold
+
+    @classmethod
+    def from_dict(cls, weights: Dict[str, float]) -> "Weights":
+        return cls(
+            weights.get("gap_percent", 0.4),
+            weights.get("rvol", 0.3),
+            weights.get("atr_stretch", 0.2),
+            weights.get("catalyst", 0.1),
+            max(0.0001, weights.get("atr_threshold", 2.0)),
+        )
+
+## -------------------------------------------------------------------
+## Column Scoring (select_final_pick / score_snapshots)
+##  - Same rules as the scalar helpers above, over NumPy columns
+##  - Comparisons are negations of the scalar rules so NaN fields come out
+##    the same (e.g. ~(den <= 0) divides where `den <= 0` is False)
+## -------------------------------------------------------------------
+def _ratio_cols(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """num / den, 0.0 where den <= 0."""
+    out = np.zeros(np.broadcast(num, den).shape)
+    np.divide(num, den, out=out, where=~(den <= 0))
+    return out
+
+def _gap_pct_cols(prev_close: np.ndarray, ref_price: np.ndarray) -> np.ndarray:
+    return _ratio_cols(ref_price - prev_close, prev_close) * 100.0
+
+def _passes_filters_cols(cols: CandidateArrays, min_liquidity: int) -> np.ndarray:
+    """passes_filters' price/liquidity rules as a mask (the time check is the caller's)."""
+    return ~(cols.last_price <= cols.premarket_high) & ~(cols.intraday_volume < min_liquidity)
+
+def _final_score_cols(
+    gap_pct: np.ndarray, rvol: np.ndarray, atr_stretch: np.ndarray, has_catalyst: np.ndarray, w: Weights,
+) -> np.ndarray:
+    """calculate_final_score per row: same clamps, same summation order."""
+    gap_s = np.where((gap_pct > 0.0) & (gap_pct <= 100.0), gap_pct, np.where(gap_pct > 100.0, 100.0, 0.0))
+    rvol_s = np.where(rvol < 0.0, 0.0, np.where(rvol > 5.0, 5.0, rvol)) * 10.0
+    left = 1.0 - atr_stretch / w.thr
+    atr_s = np.where(atr_stretch >= w.thr, 0.0, np.where(left > 0.0, left, 0.0) * 100.0)
+    cat_s = np.where(has_catalyst, 100.0, 0.0)
+    return gap_s * w.gap + rvol_s * w.rvol + atr_s * w.atr + cat_s * w.cat
+
 ## -------------------------------------------------------------------
 ## Final Pick Selection
 ## -------------------------------------------------------------------
-def select_final_pick(
-    candidates: Iterable[Candidate],
-    *,
-    weights: Dict[str, float],
-    min_liquidity: int,
-) -> Optional[Dict[str, object]]:
-    """Applies filters + scoring and returns a dict representing the winning row for CSV."""
-    scored: List[Dict[str, object]] = []
+def _with_overrides(cands: List[Candidate], name: str, computed: np.ndarray) -> np.ndarray:
+    """`computed`, except where a candidate already carries its own value for `name`."""
+    given = [getattr(c, name) for c in cands]
+    if all(v is None for v in given):
+        return computed
+    has = np.array([v is not None for v in given])
+    return np.where(has, np.array([0.0 if v is None else v for v in given], dtype=np.float64), computed)
+
+# Below this many candidates, scoring them one by one beats building columns
+VECTORIZE_MIN_CANDIDATES = 64
 
-    for c in candidates:
-        if not passes_filters(c, min_liquidity=min_liquidity):
+# (candidate, gap_pct, rvol, atr_stretch, final_score) of the winner
+_Pick = Tuple[Candidate, float, float, float, float]
+
+def _pick_scalar(cands: List[Candidate], weights: Dict[str, float], min_liquidity: int) -> Optional[_Pick]:
+    best: Optional[_Pick] = None
+    for c in cands:
+        if not passes_filters(c, min_liquidity, after935=True):
             continue
 
         gap_pct = c.gap_pct if c.gap_pct is not None else compute_gap_pct(c.prev_close, c.last_price)
@@ -133,51 +209,114 @@ def select_final_pick(
             has_catalyst=c.has_catalyst,
             weights=weights,
         )
+        # Strict > keeps the first of any ties, like max() in _pick_vectorized
+        if best is None or round(final_score, 2) > round(best[4], 2):
+            best = (c, gap_pct, rvol, atr_stretch, final_score)
+    return best
 
-        reason_bits = []
-        if c.last_price > c.premarket_high:
-            reason_bits.append("Above PMH")
-        if rvol >= 1.5:
-            reason_bits.append(f"RVOL {rvol:.2f}x")
-        if c.has_catalyst:
-            reason_bits.append("Catalyst")
-        reason = ", ".join(reason_bits) or "Rules satisfied"
-
-        scored.append({
-            "Date": c.date,
-            "Ticker": c.ticker,
-            "PremarketHigh": round(c.premarket_high, 4),
-            "OpenPrice": round(c.open_price, 4),
-            "PickPrice": round(c.last_price, 4),
-            "GapPct": round(gap_pct, 2),
-            "RVOL": round(rvol, 2),
-            "ATRStretch": round(atr_stretch, 2),
-            "Catalyst": bool(c.has_catalyst),
-            "FinalScore": round(final_score, 2),
-            "Reason": reason,
-        })
+def _pick_vectorized(cands: List[Candidate], weights: Dict[str, float], min_liquidity: int) -> Optional[_Pick]:
+    w = Weights.from_dict(weights)
 
-    if not scored:
+    # Filters and scores for every candidate at once, as array ops;
+    # inf - inf and the like are NaN silently, as with Python floats
+    cols = Candidate.to_soa(cands)
+    with np.errstate(invalid="ignore", over="ignore"):
+        pass_mask = _passes_filters_cols(cols, min_liquidity)
+        gap = _with_overrides(cands, "gap_pct", _gap_pct_cols(cols.prev_close, cols.last_price))
+        rel_vol = _with_overrides(cands, "rvol", _ratio_cols(cols.intraday_volume, cols.avg_daily_volume))
+        stretch = _with_overrides(
+            cands, "atr_stretch", _ratio_cols(cols.last_price - cols.prev_close, cols.atr_14)
+        )
+        final = _final_score_cols(gap, rel_vol, stretch, cols.has_catalyst, w)
+
+    passing = np.flatnonzero(pass_mask).tolist()
+    if not passing:
+        return None
+
+    # Winner on the rounded score the row reports; max() keeps the first of
+    # any ties, as the stable descending sort used to
+    finals = final.tolist()
+    i = max(passing, key=lambda j: round(finals[j], 2))
+    c = cands[i]
+    # Precomputed values are reported as given (not as float64 copies)
+    return (
+        c,
+        c.gap_pct if c.gap_pct is not None else gap.item(i),
+        c.rvol if c.rvol is not None else rel_vol.item(i),
+        c.atr_stretch if c.atr_stretch is not None else stretch.item(i),
+        finals[i],
+    )
+
+def select_final_pick(
+    candidates: Iterable[Candidate],
+    *,
+    weights: Dict[str, float],
+    min_liquidity: int,
+) -> Optional[Dict[str, object]]:
+    """Applies filters + scoring and returns a dict representing the winning row for CSV."""
+    cands = list(candidates)
+    if not cands or not is_after_935_et():  # one clock/zoneinfo lookup per call
         return None
 
-    scored.sort(key=lambda r: r["FinalScore"], reverse=True)
-    return scored[0]
+    pick = _pick_vectorized if len(cands) >= VECTORIZE_MIN_CANDIDATES else _pick_scalar
+    best = pick(cands, weights, min_liquidity)
+    if best is None:
+        return None
+    # Only the winner's row is built
+    c, gap_pct, rvol, atr_stretch, final_score = best
+
+    reason_bits = []
+    if c.last_price > c.premarket_high:
+        reason_bits.append("Above PMH")
+    if rvol >= 1.5:
+        reason_bits.append(f"RVOL {rvol:.2f}x")
+    if c.has_catalyst:
+        reason_bits.append("Catalyst")
+    reason = ", ".join(reason_bits) or "Rules satisfied"
+
+    return {
+        "Date": c.date,
+        "Ticker": c.ticker,
+        "PremarketHigh": round(c.premarket_high, 4),
+        "OpenPrice": round(c.open_price, 4),
+        "PickPrice": round(c.last_price, 4),
+        "GapPct": round(gap_pct, 2),
+        "RVOL": round(rvol, 2),
+        "ATRStretch": round(atr_stretch, 2),
+        "Catalyst": bool(c.has_catalyst),
+        "FinalScore": round(final_score, 2),
+        "Reason": reason,
+    }
 
 ## -------------------------------------------------------------------
 ## Snapshot Scoring + Logging
 ## -------------------------------------------------------------------
 def score_snapshots(snap_dict: Dict[str, Dict]) -> List[Dict]:
     """Very simple scoring passthrough for compatibility with scanner."""
+    tickers = list(snap_dict)
+    snaps = list(snap_dict.values())
+    n = len(snaps)
+
+    # Gap % for every ticker in one vectorized pass (same math as compute_gap_pct)
+    last = np.fromiter((s.get("last_price", 0) or 0.0 for s in snaps), dtype=np.float64, count=n)
+    prev = np.fromiter((s.get("prev_close", 0) or 0.0 for s in snaps), dtype=np.float64, count=n)
+    with np.errstate(invalid="ignore", over="ignore"):
+        gap = _gap_pct_cols(prev, last)
+
+    # Stable descending sort, same tie order as sorted(..., reverse=True)
+    order = np.argsort(-gap, kind="stable").tolist()
+    gaps = gap.tolist()
     rows = []
-    for tkr, snap in snap_dict.items():
+    for i in order:
+        snap = snaps[i]
         rows.append({
-            "ticker": tkr,
+            "ticker": tickers[i],
             "last_price": snap.get("last_price"),
             "prev_close": snap.get("prev_close"),
-            "gap_pct": compute_gap_pct(snap.get("prev_close", 0) or 0, snap.get("last_price", 0) or 0),
+            "gap_pct": gaps[i],
             "volume": snap.get("volume", 0),
         })
-    return sorted(rows, key=lambda r: r["gap_pct"], reverse=True)
+    return rows
 
 def log_top_movers(scored, snapshots=None, n=5, tag=""):
     """
@@ -190,8 +329,11 @@ def log_top_movers(scored, snapshots=None, n=5, tag=""):
         logger.warning(f"{tag} No movers available to log.")
         return
 
-    logger.info(f"{tag} Top {n} movers by gap %:")
-    tz = pytz.timezone("America/New_York")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    # One multi-line record instead of one per mover
+    lines = [f"{tag} Top {n} movers by gap %:"]
 
     for row in top:
         if isinstance(row, tuple):
@@ -211,7 +353,7 @@ def log_top_movers(scored, snapshots=None, n=5, tag=""):
         if ts:
             try:
                 if isinstance(ts, (int, float)):  # epoch ms
-                    ts_dt = datetime.fromtimestamp(ts / 1000, tz=tz)
+                    ts_dt = datetime.fromtimestamp(ts / 1000, tz=NY)
                     ts_str = ts_dt.strftime("%H:%M:%S")
                 else:
                     ts_str = str(ts)
@@ -219,10 +361,12 @@ def log_top_movers(scored, snapshots=None, n=5, tag=""):
                 ts_str = str(ts)
 
         if price and ts_str:
-            logger.info(f"{tag}   {ticker}: ${price:.2f} ({gain:.2f}%) @ {ts_str} ET")
+            lines.append(f"{tag}   {ticker}: ${price:.2f} ({gain:.2f}%) @ {ts_str} ET")
         elif price:
-            logger.info(f"{tag}   {ticker}: ${price:.2f} ({gain:.2f}%)")
+            lines.append(f"{tag}   {ticker}: ${price:.2f} ({gain:.2f}%)")
         elif ts_str:
-            logger.info(f"{tag}   {ticker}: ({gain:.2f}%) @ {ts_str} ET [no price]")
+            lines.append(f"{tag}   {ticker}: ({gain:.2f}%) @ {ts_str} ET [no price]")
         else:
-            logger.info(f"{tag}   {ticker}: ({gain:.2f}%) [no price]")
+            lines.append(f"{tag}   {ticker}: ({gain:.2f}%) [no price]")
+
+    logger.info("\n".join(lines))
@@ -8,6 +8,7 @@ from __future__ import annotations
 # -------------------------------------------------------------------
 
 import os
+import re
 import sys
 import csv
 import time
@@ -15,26 +16,28 @@ import yaml
 import shutil
 import logging
 import pytz
+import numpy as np
 from datetime import datetime
 from pathlib import Path
-from dotenv import load_dotenv
 
 # Core + adapters
 from src.core.scoring import score_snapshots, log_top_movers
-from src.core.output import write_watchlist
+from src.core.output import write_watchlist, flush_writes
 from src.adapters import polygon_adapter as pa
 from src.adapters.polygon_adapter import fetch_snapshots
+from src.adapters._cache import stats as cache_stats
+from src.core import env
 
 
 # -------------------------------------------------------------------
 # Env / Config / Logger
 # -------------------------------------------------------------------
-ROOT = Path(__file__).resolve().parents[2]
-ENV_PATH = ROOT / ".env"
+ROOT = env.ROOT
+ENV_PATH = env.ENV_PATH
 CONFIG_PATH = ROOT / "configs" / "scanner.yaml"
 
 print(f"DEBUG: Expecting .env at {ENV_PATH}")
-load_dotenv(ENV_PATH)
+env.load()
 
 if not os.getenv("POLYGON_API_KEY"):
     raise RuntimeError(f"❌ POLYGON_API_KEY not loaded. Expected in {ENV_PATH}")
@@ -143,60 +146,70 @@ def within_open_selection_window(cfg: dict) -> bool:
     return start_dt <= now <= end_dt
 
 
+## -------------------------------------------------------------------
+## BLOCK: suspicious-ticker-filter  |  FILE: src/scanner/scanner.py
+## PURPOSE: Drop warrants/rights/units/preferreds (5+ char symbols ending in
+##          W, WS, R, U, P*) before any Polygon call is spent on them
+## -------------------------------------------------------------------
+_SUSPICIOUS_TICKER = re.compile(r".+(W|WS|R|U|P[A-Z]?)$")
+
+
+def is_suspicious_ticker(sym: str) -> bool:
+    return len(sym) > 4 and _SUSPICIOUS_TICKER.match(sym) is not None
+
+
 ## -------------------------------------------------------------------
 ## BLOCK: prefilter-top-gappers-v2  |  FILE: src/scanner/scanner.py  |  DATE: 2025-09-29
 ## PURPOSE: Rank by %Gap using robust snapshot fields:
 ##   - Prefer last_price; fallback to close (regular session close)
 ##   - Require prev_close > 0; enforce min_price on chosen price
+##   - Skips warrant/right/unit symbols (is_suspicious_ticker)
 ##   - Adds basic diagnostics to help explain empty pools
 ## -------------------------------------------------------------------
 def prefilter_top_gappers(snaps: list[dict], n: int = 100, min_price: float = 1.0) -> list[dict]:
-    pool = []
-    skipped_missing = 0
-    skipped_price   = 0
-    for s in snaps or []:
-        # choose a price: last_price (preferred), else close
-        last = s.get("last_price")
-        close = s.get("close")
-        price = last if last is not None else close
-
-        prev = s.get("prev_close")
-        if price is None or prev is None or prev <= 0:
-            skipped_missing += 1
-            continue
-        try:
-            price_f = float(price)
-            prev_f  = float(prev)
-        except Exception:
-            skipped_missing += 1
-            continue
+    snaps = snaps or []
 
-        if price_f < float(min_price):
-            skipped_price += 1
-            continue
+    # Whole-snapshot checks run as array ops; only the top n rows become dicts
+    cols = pa.snapshot_columns(snaps, ("last_price", "close", "prev_close"))
+    suspicious = np.fromiter(
+        (is_suspicious_ticker(s.get("ticker") or "") for s in snaps), dtype=bool, count=len(snaps)
+    )
 
-        try:
-            gap = (price_f - prev_f) / prev_f * 100.0
-        except Exception:
-            skipped_missing += 1
-            continue
+    # choose a price: last_price (preferred), else close
+    last = cols["last_price"]
+    price = np.where(np.isnan(last), cols["close"], last)
+    prev = cols["prev_close"]
+    with np.errstate(invalid="ignore"):
+        missing = ~suspicious & (np.isnan(price) | ~(prev > 0))
+        too_cheap = ~suspicious & ~missing & (price < float(min_price))
+
+    skipped_suffix  = int(suspicious.sum())
+    skipped_missing = int(missing.sum())
+    skipped_price   = int(too_cheap.sum())
+
+    keep = np.flatnonzero(~suspicious & ~missing & ~too_cheap)
+    price_k = price[keep]
+    prev_k = prev[keep]
+    gap = (price_k - prev_k) / prev_k * 100.0
+    # Stable descending order, same tie order as list.sort(reverse=True)
+    order = np.argsort(-gap, kind="stable")
 
-        s2 = dict(s)
-        s2["_gap_pct_snapshot"] = gap
-        s2["_prefilter_price"]  = price_f  # for optional debugging
+    pool = []
+    for k in order[:n]:
+        s2 = dict(snaps[keep[k]])
+        s2["_gap_pct_snapshot"] = float(gap[k])
+        s2["_prefilter_price"]  = float(price_k[k])  # for optional debugging
         pool.append(s2)
 
-    pool.sort(key=lambda x: x.get("_gap_pct_snapshot", 0.0), reverse=True)
-
     # Optional: quick diagnostic line if pool ends up empty (uses global logger if present)
     try:
         logger = logging.getLogger("scanner")
         if not pool:
-            logger.info(f"ℹ️ [Open] Prefilter diagnostics: skipped_missing={skipped_missing}, skipped_price={skipped_price}")
+            logger.info(f"ℹ️ [Open] Prefilter diagnostics: skipped_missing={skipped_missing}, skipped_price={skipped_price}, skipped_suffix={skipped_suffix}")
     except Exception:
         pass
 
-    return pool[:n]
+    return pool
 
 
 ## -------------------------------------------------------------------
@@ -316,18 +329,21 @@ def enrich_rows(
     Returns rows enriched for scoring & CSV output.
     """
     enriched: list[dict] = []
-    for s in snapshots:
-        tkr = s.get("ticker")
-        if not tkr:
-            continue
+    snapshots = [s for s in snapshots if s.get("ticker") and not is_suspicious_ticker(s["ticker"])]
 
-        prev_close = pa.get_previous_close(tkr)
-        pm_high = pa.get_premarket_high(tkr, trade_date)
-        atr_14 = pa.get_atr_14(tkr, trade_date)
+    # Adapter lookups run concurrently across all tickers
+    lookups = pa.enrich_tickers([s["ticker"] for s in snapshots], trade_date)
 
-        # Pull intraday/avg volumes from adapter
-        intraday_vol = pa.get_intraday_volume(tkr, trade_date)
-        avg_vol = pa.get_avg_daily_volume(tkr, lookback=20)
+    for s, info in zip(snapshots, lookups):
+        tkr = s["ticker"]
+
+        prev_close = info["prev_close"]
+        pm_high = info["premarket_high"]
+        atr_14 = info["atr_14"]
+
+        # Intraday/avg volumes from adapter
+        intraday_vol = info["intraday_volume"]
+        avg_vol = info["avg_daily_volume"]
 
         # Prices: prefer snapshot last_price if present; fall back gracefully
         last_price = s.get("last_price") or prev_close or 0.0
@@ -670,7 +686,8 @@ def run_once(cfg: dict, logger: logging.Logger, force_final_pick: bool = False)
     ## PURPOSE: Combine fast fetch_snapshots() with per-ticker snapshots for top movers
     ## NOTES:
     ##   - Keeps performance (bulk scan of 11k+)
-    ##   - Restores premarket coverage with Polygon per-ticker snapshot (lastTrade)
+    ##   - Restores premarket coverage with Polygon snapshots (lastTrade) for
+    ##     the top movers, fetched in one bulk `tickers=` request
     ##   - Replaces `snaps` with enriched list for downstream logic
     ## -------------------------------------------------------------------
     rough = []
@@ -691,21 +708,24 @@ def run_once(cfg: dict, logger: logging.Logger, force_final_pick: bool = False)
     logger.info(f"[HYBRID] Enriching top {len(top_syms)} tickers with per-ticker snapshots")
 
     enriched = []
-    for sym in top_syms:
-        try:
-            snap = pa.get_snapshot(sym)  # per-ticker snapshot (extended hours included)
-            prev = snap.get("prevDay", {}).get("close")
-            pre  = snap.get("lastTrade", {}).get("p")
-            if prev and pre:
-                gap = (pre - prev) / prev * 100.0
-                enriched.append({
-                    "ticker": sym,
-                    "gap_percent": gap,
-                    "premarket_price": pre,
-                    "prev_close": prev
-                })
-        except Exception as e:
-            logger.warning(f"[HYBRID] Failed per-ticker snapshot for {sym}: {e}")
+    try:
+        top_snaps = pa.fetch_snapshots_for(top_syms)  # extended hours included
+    except Exception as e:
+        logger.warning(f"[HYBRID] Failed bulk snapshot for {len(top_syms)} tickers: {e}")
+        top_snaps = []
+    by_sym = {snap["ticker"]: snap for snap in top_snaps}
+    for sym in top_syms:  # keep rough-gap order
+        snap = by_sym.get(sym) or {}
+        prev = snap.get("prev_close")
+        pre  = snap.get("last_price")
+        if prev and pre:
+            gap = (pre - prev) / prev * 100.0
+            enriched.append({
+                "ticker": sym,
+                "gap_percent": gap,
+                "premarket_price": pre,
+                "prev_close": prev
+            })
 
     # Replace snaps for downstream processing
     snaps = enriched
@@ -1008,6 +1028,7 @@ def run() -> None:
 
     # Always reset/seed today_pick with the template at process start
     ensure_today_pick_ready(cfg, reset=True)
+    pa.refresh()  # start the session with empty adapter caches
     logger.info("Starting premarket scanner loop...")
 
     while within_premarket_window(cfg):
@@ -1015,6 +1036,8 @@ def run() -> None:
             run_once(cfg, logger, force_final_pick=False)
         except Exception as e:
             logger.error(f"❌ Error during scan tick: {e}", exc_info=True)
+        finally:
+            flush_writes()  # this tick's watchlist rows are on disk before we sleep
         time.sleep(cadence * 60)
 
     logger.info("Premarket window closed.")
@@ -1022,6 +1045,8 @@ def run() -> None:
     # Single open-selection pass (09:30–09:35 ET)
     run_open_selection_once(cfg, logger)
 
+    for name, info in cache_stats().items():
+        logger.info(f"🗄️ Cache {name}: hits={info['hits']} misses={info['misses']}")
     logger.info("Scanner stopped.")
 
 # -------------------------------------------------------------------
@@ -1043,6 +1068,8 @@ if __name__ == "__main__":
             run_once(cfg, logger, force_final_pick=force)
         except Exception as e:
             logger.error(f"❌ Error in --once run: {e}", exc_info=True)
+        finally:
+            flush_writes()
     else:
         # IMPORTANT: do NOT set up logger here; run() will do it
         run()
@@ -0,0 +1,110 @@
+import random
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import numpy as np
+
+import analyze_eod
+from analyze_eod import StockTrajectory, _to_time
+
+
+def full_scan_windows(appearances):
+    """Entry/exit windows computed the original way, over every appearance."""
+    first_ts = appearances[0][0]
+    peak_ts, peak = appearances[0]
+    for ts, price in appearances:
+        if price > peak:
+            peak_ts, peak = ts, price
+
+    def window(apps):
+        return (_to_time(apps[0][0]).strftime("%H:%M"), _to_time(apps[-1][0]).strftime("%H:%M"),
+                min(p for _, p in apps), max(p for _, p in apps))
+
+    entry = [a for a in appearances[:10] if a[0] <= first_ts + 30 * 60] or appearances[:1]
+    exit_ = [a for a in appearances if a[1] >= peak * 0.98]
+    return window(entry), window(exit_)
+
+
+def make_trajectory(appearances):
+    traj = StockTrajectory("TEST")
+    for ts, price in appearances:
+        traj.add_appearance(ts, price, 0.0, 2_000_000.0, 0.0)
+    return traj
+
+
+def test_streaming_windows_match_full_scan():
+    rng = random.Random(7)
+    start = 1_760_000_000  # 2025-10-09, naive-ET epoch seconds
+    for _ in range(500):
+        ts, price = start + rng.randrange(0, 6 * 3600), rng.uniform(1, 20)
+        appearances = []
+        for _ in range(rng.randint(1, 200)):
+            ts += rng.choice([0, 5, 30, 60, 300, 900])
+            price = round(max(0.5, price * rng.uniform(0.97, 1.035)), 2)
+            appearances.append((ts, price))
+
+        traj = make_trajectory(appearances)
+        entry, exit_ = full_scan_windows(appearances)
+        assert traj.get_entry_window() == entry
+        assert traj.get_exit_window() == exit_
+
+
+def test_exit_window_after_peak_moves_up():
+    # An earlier near-peak cluster must drop out once a higher peak arrives
+    traj = make_trajectory([(0, 10.0), (60, 10.1), (120, 12.0), (180, 11.9)])
+    assert traj.get_exit_window() == ("00:02", "00:03", 11.9, 12.0)
+    assert traj.get_entry_window() == ("00:00", "00:03", 10.0, 12.0)
+
+
+
+def test_slow_climber_keeps_only_the_near_peak_tail():
+    # +0.01% per appearance: every new high is within 2% of the last one,
+    # so only the appearances still within 2% of the final peak may be held
+    appearances, price = [], 10.0
+    for i in range(20_000):
+        price *= 1.0001
+        appearances.append((1_760_000_000 + i, price))
+
+    traj = make_trajectory(appearances)
+    assert len(traj.near_peak) <= 205  # ~ln(1/0.98) / ln(1.0001)
+    assert traj.get_exit_window() == full_scan_windows(appearances)[1]
+
+def test_score_and_filter_numpy_matches_loop():
+    rng = np.random.default_rng(3)
+    n = 2000
+    open_p = rng.choice([0.0, 1.0, 5.0, np.nan], n) + rng.uniform(0, 10, n) * (rng.random(n) < 0.9)
+    peak_p = open_p * rng.uniform(0.9, 1.5, n)
+    max_vol = rng.choice([0.0, 999_999.0, 1_000_000.0, 5e6], n)
+    first = 1_760_000_000 + rng.integers(0, 86400, n)
+    peak = first + rng.choice([0, 299, 300, 3600], n)
+
+    args = (open_p, peak_p, max_vol, first, peak, 8.0, 1_000_000.0)
+    gains_loop, keep_loop = analyze_eod._score_and_filter_loop(*args)
+    gains_np, keep_np = analyze_eod._score_and_filter_numpy(*args)
+    np.testing.assert_array_equal(gains_np, gains_loop)
+    np.testing.assert_array_equal(keep_np, keep_loop)
+    # and whichever one score_and_filter resolved to
+    np.testing.assert_array_equal(analyze_eod.score_and_filter(*args)[1], keep_loop)
+
+
+def test_load_journal_trades_maps_header_and_pads_short_rows(tmp_path, monkeypatch):
+    journal = tmp_path / "journal.csv"
+    journal.write_text(
+        "ticker,date,pl_dollar,entry_price,shares\n"
+        "AAA,2025-10-08,10,1.5,100\n"
+        "BBB,2025-10-08\n"
+        "CCC,not-a-date,1,1,1\n"
+        "DDD,2025-10-09,1,1,1\n"
+    )
+    monkeypatch.setattr(analyze_eod, "JOURNAL_CSV", str(journal))
+
+    trades = analyze_eod.load_journal_trades(date(2025, 10, 8))
+    assert [t[analyze_eod.J_TICKER] for t in trades] == ["AAA", "BBB"]
+    aaa, bbb = trades
+    assert (aaa[analyze_eod.J_ENTRY], aaa[analyze_eod.J_SHARES], aaa[analyze_eod.J_PL_DOLLAR]) == ("1.5", "100", "10")
+    assert aaa[analyze_eod.J_EXIT] == ""  # column not in this file
+    assert all(len(t) == len(analyze_eod.J_FIELDS) for t in trades)
+    assert bbb[analyze_eod.J_ENTRY] == ""
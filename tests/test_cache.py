@@ -0,0 +1,76 @@
+import threading
+
+import pytest
+
+from src.adapters import _cache
+from src.adapters._cache import TTLCache, cached, stats
+
+
+@pytest.fixture(autouse=True)
+def no_redis(monkeypatch):
+    monkeypatch.setattr(_cache, "_REDIS", None)
+    monkeypatch.setattr(_cache, "_REDIS_CHECKED", True)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(_cache.time, "time", lambda: now[0])
+    return now
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache("test_expiry")
+    calls = []
+    compute = lambda: calls.append(1) or len(calls)
+
+    assert cache.get_or_set("k", 60, compute) == 1
+    clock[0] += 59
+    assert cache.get_or_set("k", 60, compute) == 1
+    clock[0] += 2
+    assert cache.get_or_set("k", 60, compute) == 2
+    assert cache.info() == {"hits": 1, "misses": 2, "size": 1}
+
+
+def test_exceptions_are_not_cached():
+    cache = TTLCache("test_errors")
+    with pytest.raises(ValueError):
+        cache.get_or_set("k", 60, lambda: (_ for _ in ()).throw(ValueError()))
+    assert cache.get_or_set("k", 60, lambda: "ok") == "ok"
+
+
+def test_cached_keys_include_args_and_scope():
+    day = ["2025-10-08"]
+    calls = []
+
+    @cached(ttl=lambda ticker: 60, scope=lambda: day[0])
+    def _lookup_test_scope(ticker):
+        calls.append(ticker)
+        return f"{ticker}@{day[0]}"
+
+    assert _lookup_test_scope("AAA") == "AAA@2025-10-08"
+    assert _lookup_test_scope("AAA") == "AAA@2025-10-08"
+    assert _lookup_test_scope("BBB") == "BBB@2025-10-08"
+    day[0] = "2025-10-09"  # new scope: a fresh key, not yesterday's value
+    assert _lookup_test_scope("AAA") == "AAA@2025-10-09"
+    assert calls == ["AAA", "BBB", "AAA"]
+
+    assert stats()["lookup_test_scope"] == {"hits": 1, "misses": 3, "size": 3}
+    _lookup_test_scope.cache_clear()
+    assert _lookup_test_scope.cache_info()["size"] == 0
+
+
+def test_counts_are_exact_under_threads():
+    cache = TTLCache("test_threads")
+    cache.get_or_set("k", 600, lambda: 1)
+
+    def worker():
+        for _ in range(2000):
+            cache.get_or_set("k", 600, lambda: 1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert cache.info() == {"hits": 16000, "misses": 1, "size": 1}
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from src.core import scoring
+from src.core.scoring import Candidate, compute_gap_pct, passes_filters, select_final_pick
+
+
+def make_candidate(rng, **overrides):
+    fields = dict(
+        date="2025-10-03", ticker=rng.choice("ABCDE"),
+        premarket_high=rng.choice([rng.uniform(0, 10), float("nan")]), open_price=1.0,
+        last_price=rng.choice([rng.uniform(0, 12), float("inf")]), intraday_volume=rng.randint(0, 1000),
+        avg_daily_volume=rng.choice([0, rng.uniform(0, 900), float("nan")]),
+        prev_close=rng.choice([0, rng.uniform(0, 10), float("nan")]),
+        has_catalyst=rng.random() < 0.5, atr_14=rng.choice([0, rng.uniform(0, 3)]),
+    )
+    if rng.random() < 0.3:
+        extra = lambda: rng.choice([rng.uniform(-50, 300), 0.0, 100.0, float("nan")])
+        fields.update(gap_pct=extra(), rvol=extra(), atr_stretch=extra())
+    fields.update(overrides)
+    return Candidate(**fields)
+
+
+@pytest.fixture
+def after_935(monkeypatch):
+    monkeypatch.setattr(scoring, "is_after_935_et", lambda now=None: True)
+
+
+def test_scalar_helpers_stay_scalar():
+    assert compute_gap_pct(0, 5.0) == 0.0
+    assert type(compute_gap_pct(4.0, 5.0)) is float
+    assert compute_gap_pct(4.0, 5.0) == 25.0
+
+
+def test_passes_filters_two_argument_form(after_935):
+    rng = random.Random(0)
+    c = make_candidate(rng, premarket_high=5.0, last_price=6.0, intraday_volume=500)
+    assert passes_filters(c, 100)
+    assert not passes_filters(c, 1000)
+    assert not passes_filters(c, 100, after935=False)
+
+
+def test_scalar_and_vectorized_picks_agree():
+    rng = random.Random(7)
+    for _ in range(3000):
+        cands = [make_candidate(rng) for _ in range(rng.randint(1, 40))]
+        weights = rng.choice([{}, {"gap_percent": rng.random(), "atr_threshold": rng.choice([0, -1, 1.5])}])
+        scalar = scoring._pick_scalar(cands, weights, 100)
+        vectorized = scoring._pick_vectorized(cands, weights, 100)
+        assert repr(scalar) == repr(vectorized)
+
+
+def test_select_final_pick_same_row_either_side_of_cutover(after_935, monkeypatch):
+    rng = random.Random(3)
+    cands = [make_candidate(rng, premarket_high=1.0, last_price=rng.uniform(2, 9), intraday_volume=500)
+             for _ in range(10)]
+    row = select_final_pick(cands, weights={}, min_liquidity=100)
+    monkeypatch.setattr(scoring, "VECTORIZE_MIN_CANDIDATES", 1)
+    assert select_final_pick(cands, weights={}, min_liquidity=100) == row
+    assert row["Reason"].startswith("Above PMH")
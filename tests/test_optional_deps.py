@@ -0,0 +1,249 @@
+"""
+Both branches of every optional dependency (requirements-optional.txt):
+the accelerated path runs when the package is installed (importorskip),
+the fallback by setting the module's handle to None.
+"""
+import importlib
+import io
+import json
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import analyze_eod
+import validate_csv
+from src.adapters import _cache
+from src.adapters import polygon_adapter as pa
+from src.analysis import scan_analyzer
+
+LOG_LINES = [
+    "2025-10-03 09:45:12,345 [INFO]    ABCD: score=92.1 gap=+35.2% last=4.12 prev=3.05 vol=12.3M",
+    "2025-10-03 09:45:12,346 [INFO] Top 5 (score=desc):",
+    "garbage score=1.0",
+    "2025-10-03 09:46:12,345 [INFO]  XY: score=50.0 gap=-1.5% last=1.00 prev=1.02 vol=800K",
+    "2025-10-03 09:47:12,345 [INFO]\tZ1: score=10.0 gap=2.0% last=3.00 prev=2.9 vol=500",
+]
+
+
+def _groups(log_path):
+    return [m.groups() for m in scan_analyzer.ScanAnalyzer(log_path)._matches()]
+
+
+def test_scan_analyzer_hyperscan_matches_plain_scan(tmp_path, monkeypatch):
+    pytest.importorskip("hyperscan")
+    log = tmp_path / "scanner.log"
+    log.write_text("\n".join(LOG_LINES) + "\n")
+    fast = _groups(log)
+    monkeypatch.setattr(scan_analyzer, "hyperscan", None)
+    assert fast == _groups(log)
+    assert [g[1] for g in fast] == [b"ABCD", b"XY", b"Z1"]
+
+
+def test_scan_analyzer_hyperscan_empty_log(tmp_path):
+    pytest.importorskip("hyperscan")
+    log = tmp_path / "scanner.log"
+    log.write_bytes(b"")
+    assert _groups(log) == []
+
+
+class _Resp:
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode()
+
+
+SNAPSHOT = {"ticker": "ABCD", "lastTrade": {"p": 4.12}, "prevDay": {"c": 3.05},
+            "day": {"v": 1200, "o": 3.5, "h": 4.2, "l": 3.4, "c": 4.1}}
+
+
+@pytest.mark.parametrize("backend", ["simdjson", "orjson", "json"])
+def test_polygon_json_backends_agree(backend, monkeypatch):
+    if backend != "json":
+        pytest.importorskip(backend)
+    if backend != "simdjson":
+        monkeypatch.setattr(pa, "simdjson", None)
+    if backend == "json":
+        monkeypatch.setattr(pa, "orjson", None)
+
+    payload = {"results": [{"h": 1.5, "l": 1.0, "c": 1.2, "v": 10}], "next_url": None}
+    assert pa._json(_Resp(payload)) == payload
+    doc = pa._json_doc(_Resp(SNAPSHOT))
+    assert pa._snapshot_row(doc) == {"ticker": "ABCD", "last_price": 4.12, "prev_close": 3.05,
+                                     "volume": 1200, "open": 3.5, "high": 4.2, "low": 3.4, "close": 4.1}
+    assert pa._ptr(pa._json_doc(_Resp({"day": {}})), "/day/v") is None
+
+
+@pytest.mark.parametrize("backend", ["simdjson", "json"])
+def test_iter_snapshots_pages_while_docs_are_alive(backend, monkeypatch):
+    if backend == "simdjson":
+        pytest.importorskip("simdjson")
+    else:
+        monkeypatch.setattr(pa, "simdjson", None)
+    # keyed by the URL's last path segment: the first page, then next_url
+    pages = {
+        "tickers": {"tickers": [SNAPSHOT], "next_url": "https://api.polygon.io/page2"},
+        "page2": {"tickers": [dict(SNAPSHOT, ticker="XY")], "next_url": None},
+    }
+    monkeypatch.setattr(pa, "_require_api_key", lambda: "KEY")
+    monkeypatch.setattr(pa, "_do_get", lambda url, params: _Resp(pages[url.rsplit("/", 1)[-1]]))
+
+    held = pa._json_doc(_Resp(SNAPSHOT))  # a doc the caller still holds while paging
+    assert [row["ticker"] for row in pa.iter_snapshots()] == ["ABCD", "XY"]
+    assert pa._ptr(held, "/ticker") == "ABCD"
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"ticker": {"type": "string"}, "score": {"type": "number"}},
+    "required": ["ticker"],
+}
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_compile_schema_backends(compiled, monkeypatch):
+    if compiled:
+        pytest.importorskip("jsonschema_rs")
+    else:
+        monkeypatch.setattr(validate_csv, "jsonschema_rs", None)
+    is_valid, error_message = validate_csv.compile_schema(SCHEMA)
+    assert is_valid({"ticker": "ABCD", "score": 1.5})
+    assert not is_valid({"ticker": "ABCD", "score": "high"})
+    assert "high" in error_message({"ticker": "ABCD", "score": "high"})
+
+
+@pytest.mark.parametrize("arrow", [True, False])
+def test_read_frame_backends(arrow, tmp_path, monkeypatch):
+    if arrow:
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setattr(validate_csv, "pv", None)
+    csv_file = tmp_path / "w.csv"
+    csv_file.write_text("ticker,score\r\nABCD,1.5\r\n2025,\r\n")
+    rows = validate_csv.read_frame(csv_file, SCHEMA).to_dict(orient="records")
+    assert rows[0] == {"ticker": "ABCD", "score": 1.5}
+    # schema says string: a numeric-looking ticker must not become a number or date
+    assert str(rows[1]["ticker"]) == "2025"
+    assert np.isnan(rows[1]["score"])
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeRedis()
+    monkeypatch.setattr(_cache, "_REDIS", server)
+    monkeypatch.setattr(_cache, "_REDIS_CHECKED", True)
+    return server
+
+
+def test_cache_redis_l2_shared_across_l1s(fake_redis):
+    calls = []
+    compute = lambda: calls.append(1) or {"atr": 1.25, "n": len(calls)}
+
+    first = _cache.TTLCache("test_l2")
+    assert first.get_or_set("polygon:test_l2:X", 60, compute) == {"atr": 1.25, "n": 1}
+    assert 0 < fake_redis.ttl("polygon:test_l2:X") <= 60
+
+    # a fresh process (empty L1) reads it back from Redis instead of computing
+    second = _cache.TTLCache("test_l2")
+    assert second.get_or_set("polygon:test_l2:X", 60, compute) == {"atr": 1.25, "n": 1}
+    assert calls == [1]
+    assert second.info() == {"hits": 1, "misses": 0, "size": 1}
+
+
+def test_cache_redis_errors_fall_through(fake_redis, monkeypatch):
+    def down(*_a, **_k):
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(fake_redis, "get", down)
+    monkeypatch.setattr(fake_redis, "set", down)
+    assert _cache.TTLCache("test_l2_down").get_or_set("k", 60, lambda: 7) == 7
+
+
+def test_cache_without_redis_package(monkeypatch):
+    monkeypatch.setattr(_cache, "redis", None)
+    monkeypatch.setattr(_cache, "_REDIS", None)
+    monkeypatch.setattr(_cache, "_REDIS_CHECKED", False)
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+    assert _cache._redis() is None
+
+
+@pytest.fixture
+def july_7(monkeypatch):
+    # Monday after Independence Day (Friday 2025-07-04, a weekday holiday)
+    monkeypatch.setattr(pa, "_today_ny", lambda: datetime(2025, 7, 7, 10, 0, tzinfo=pa._NY_TZ))
+    pa._nyse_sessions.cache_clear()
+    yield
+    pa._nyse_sessions.cache_clear()
+
+
+def test_recent_sessions_with_exchange_calendar(july_7):
+    pytest.importorskip("pandas_market_calendars")
+    assert pa._recent_sessions(4) == [date(2025, 7, 7), date(2025, 7, 3), date(2025, 7, 2), date(2025, 7, 1)]
+    assert pa._nth_session_ago(1) == date(2025, 7, 3)
+
+
+def test_recent_sessions_weekday_fallback(july_7, monkeypatch):
+    monkeypatch.setattr(pa, "mcal", None)
+    sessions = pa._recent_sessions(4)
+    # holidays aren't known: weekdays, padded by HOLIDAY_SLACK_WEEKDAYS
+    assert len(sessions) == 4 + pa.HOLIDAY_SLACK_WEEKDAYS
+    assert sessions[:3] == [date(2025, 7, 7), date(2025, 7, 4), date(2025, 7, 3)]
+    assert all(d.weekday() < 5 for d in sessions)
+
+
+@pytest.fixture
+def reload_without(monkeypatch):
+    """reload_without(module, "pkg"): re-import module as if pkg weren't installed."""
+    reloaded = []
+
+    def reload(module, name):
+        monkeypatch.setitem(sys.modules, name, None)  # makes `import name` raise ImportError
+        reloaded.append(module)
+        return importlib.reload(module)
+
+    yield reload
+    monkeypatch.undo()
+    for module in reloaded:
+        importlib.reload(module)
+
+
+def test_brotli_advertised_only_when_decodable(reload_without):
+    brotli = pytest.importorskip("brotli")
+    from urllib3.response import HTTPResponse
+
+    assert pa.ACCEPT_ENCODING == "gzip, deflate, br"
+    body = b'{"results": []}'
+    resp = HTTPResponse(body=io.BytesIO(brotli.compress(body)),
+                        headers={"content-encoding": "br"}, preload_content=False)
+    assert resp.read(decode_content=True) == body
+
+    assert reload_without(pa, "brotli").ACCEPT_ENCODING == "gzip, deflate"
+
+
+def test_http2_only_when_h2_installed(reload_without):
+    pytest.importorskip("h2")
+    from src.adapters import polygon_async
+
+    assert polygon_async._HTTP2 is True
+    polygon_async.make_client()  # httpx raises ImportError for http2=True without h2
+
+    assert reload_without(polygon_async, "h2")._HTTP2 is False
+    polygon_async.make_client()
+
+
+def test_score_and_filter_numba_matches_numpy():
+    numba = pytest.importorskip("numba")
+    rng = np.random.default_rng(3)
+    n = 500
+    open_p = rng.uniform(1, 10, n)
+    args = (open_p, open_p * rng.uniform(0.9, 2.0, n), rng.uniform(0, 5e6, n),
+            rng.integers(0, 20000, n).astype(np.float64), rng.integers(0, 20000, n).astype(np.float64),
+            20.0, 1_000_000.0)
+    gains_jit, keep_jit = numba.njit(analyze_eod._score_and_filter_loop)(*args)
+    gains_np, keep_np = analyze_eod._score_and_filter_numpy(*args)
+    np.testing.assert_allclose(gains_jit, gains_np)
+    np.testing.assert_array_equal(keep_jit, keep_np)
@@ -0,0 +1,117 @@
+import csv
+import io
+import os
+import random
+
+import numpy as np
+
+from src.core import output
+from src.core.output import _normalize_mover, append_with_header, csv_cell, csv_line
+
+SAMPLES = [
+    None, "", "plain", "a,b", 'say "hi"', "line\nbreak", "cr\rhere", "crlf\r\n", " padded ",
+    "'single'", "tab\tsep", "ünïcødé", 0, -7, 10**20, True, False,
+    0.0, -0.0, 1.5, 0.1 + 0.2, 1e-7, 1e22, float("nan"), float("inf"), np.float64(2.675), np.int64(42),
+]
+
+
+def dictwriter_line(values):
+    buf = io.StringIO()
+    fields = [f"c{i}" for i in range(len(values))]
+    csv.DictWriter(buf, fieldnames=fields).writerow(dict(zip(fields, values)))
+    return buf.getvalue()
+
+
+def test_csv_line_matches_dictwriter_per_value():
+    for v in SAMPLES:
+        assert csv_line(["x", v, "y"]) == dictwriter_line(["x", v, "y"]), repr(v)
+
+
+def test_csv_line_matches_dictwriter_random_rows():
+    rng = random.Random(11)
+    for _ in range(2000):
+        row = [rng.choice(SAMPLES) for _ in range(rng.randint(2, 12))]
+        assert csv_line(row) == dictwriter_line(row)
+
+
+def test_csv_cell_quotes_only_when_needed():
+    assert csv_cell("ABC") == "ABC"
+    assert csv_cell("a,b") == '"a,b"'
+    assert csv_cell('5" gap') == '"5"" gap"'
+    assert csv_cell(None) == ""
+    assert csv_cell(True) == "True"
+    assert csv_cell(np.float64(0.1)) == "0.1"
+
+
+def test_normalize_mover_keeps_zero_gap_and_volume():
+    assert _normalize_mover({"ticker": "AAA", "gap_pct": 0.0, "volume": 0}) == \
+        {"ticker": "AAA", "gap_pct": 0.0, "volume": 0}
+    # 0.0 under the primary key wins over an alias
+    assert _normalize_mover({"ticker": "AAA", "gap_pct": 0.0, "gap": 5.0})["gap_pct"] == 0.0
+    assert _normalize_mover({"ticker": "AAA", "gap": 0.0})["gap_pct"] == 0.0
+    assert _normalize_mover(("AAA", {"percent": 0.0, "vol": 0}))["gap_pct"] == 0.0
+
+
+def test_normalize_mover_none_falls_back_to_alias():
+    assert _normalize_mover({"ticker": "AAA", "gap_pct": None, "gap": 5.0})["gap_pct"] == 5.0
+    assert _normalize_mover({"ticker": "AAA", "gap_pct": 1.0, "volume": None, "vol": 7})["volume"] == 7
+    assert _normalize_mover({"ticker": "AAA", "gap_pct": None}) is None
+
+
+def test_normalize_mover_missing_gap_is_dropped():
+    assert _normalize_mover({"ticker": "AAA", "volume": 100}) is None
+    assert _normalize_mover(("AAA", {"volume": 100})) is None
+    # missing volume is 0, not a reason to drop
+    assert _normalize_mover({"ticker": "AAA", "gap_pct": 2.5}) == {"ticker": "AAA", "gap_pct": 2.5, "volume": 0}
+
+
+def test_append_with_header_rewrites_header_after_delete_rotate_truncate(tmp_path, monkeypatch):
+    monkeypatch.setattr(output, "_HEADER_WRITTEN", {})
+    path = tmp_path / "w.csv"
+    probes = []
+
+    def probe(p):
+        probes.append(p)
+        with open(p) as f:
+            return f.readline() == "h\n"
+
+    def append(row):
+        append_with_header(path, "h\n", row, probe)
+
+    append("1\n")
+    append("2\n")
+    assert path.read_text() == "h\n1\n2\n"
+    assert probes == []  # we wrote the header ourselves; nothing to probe
+
+    path.unlink()
+    append("3\n")
+    assert path.read_text() == "h\n3\n"
+
+    # rotation: a different file now lives at the path
+    os.rename(path, tmp_path / "w.csv.1")
+    path.write_text("no header\n")
+    append("4\n")
+    assert path.read_text() == "no header\nh\n4\n"
+    assert len(probes) == 1
+
+    path.write_text("")
+    append("5\n")
+    assert path.read_text() == "h\n5\n"
+
+
+def test_normalize_mover_ticker_by_presence():
+    assert _normalize_mover({"symbol": "BBB", "gap_pct": 1.0})["ticker"] == "BBB"
+    assert _normalize_mover({"ticker": None, "symbol": "BBB", "gap_pct": 1.0})["ticker"] == "BBB"
+    assert _normalize_mover({"ticker": "AAA", "symbol": "BBB", "gap_pct": 1.0})["ticker"] == "AAA"
+    # a blank ticker falls back to symbol
+    assert _normalize_mover({"ticker": "", "symbol": "ABC", "gap_pct": 1.0, "volume": 5}) == \
+        {"ticker": "ABC", "gap_pct": 1.0, "volume": 5}
+
+
+def test_normalize_mover_zero_gap_kept_where_or_chain_dropped_it():
+    mover = {"ticker": "AAA", "gap_pct": 0, "gap": 5.0, "volume": 0, "vol": 9}
+    # the old `or` chains skipped gap_pct=0 for gap (5.0) and volume=0 for vol (9)
+    assert _normalize_mover(mover) == {"ticker": "AAA", "gap_pct": 0.0, "volume": 0}
+    # no alias to fall through to: the or-chain gave None and dropped the mover
+    assert _normalize_mover({"ticker": "AAA", "gap_pct": 0}) == {"ticker": "AAA", "gap_pct": 0.0, "volume": 0}
+    assert _normalize_mover(("AAA", {"gap": 0})) == {"ticker": "AAA", "gap_pct": 0.0, "volume": 0}
@@ -0,0 +1,31 @@
+import requests
+
+from src.adapters import polygon_adapter as pa
+
+
+def test_enrich_tickers_isolates_a_failing_ticker(monkeypatch):
+    def prev_close(tkr):
+        if tkr == "BAD":
+            raise requests.HTTPError("500 Server Error")
+        return 10.0
+
+    def premarket_high(tkr, trade_date):
+        if tkr == "BAD":
+            raise requests.ConnectionError("reset")
+        return 11.0
+
+    monkeypatch.setattr(pa, "get_previous_close", prev_close)
+    monkeypatch.setattr(pa, "get_premarket_high", premarket_high)
+    monkeypatch.setattr(pa, "get_intraday_volume", lambda tkr, d: 500)
+    monkeypatch.setattr(pa, "get_atr_14", lambda tkr, d: 0.5)
+    monkeypatch.setattr(pa, "get_avg_daily_volume", lambda tkr: 1000)
+
+    rows = pa.enrich_tickers(["AAA", "BAD", "CCC"], "2025-10-03")
+
+    good = {"prev_close": 10.0, "premarket_high": 11.0, "intraday_volume": 500, "atr_14": 0.5,
+            "avg_daily_volume": 1000}
+    assert rows[0] == {"ticker": "AAA", **good}
+    assert rows[2] == {"ticker": "CCC", **good}
+    # the failed lookups fall back; the ones that worked are kept
+    assert rows[1] == {"ticker": "BAD", "prev_close": 0.0, "premarket_high": 0.0, "intraday_volume": 0,
+                       "atr_14": 0.5, "avg_daily_volume": 1000}
@@ -0,0 +1,50 @@
+import os
+
+import pytest
+
+os.environ.setdefault("POLYGON_API_KEY", "test-key")  # polygon_client requires one at import
+
+from src.adapters import _cache
+from src.adapters import polygon_client
+from src.adapters.polygon_client import PolygonClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(_cache, "_REDIS", None)
+    monkeypatch.setattr(_cache, "_REDIS_CHECKED", True)
+    polygon_client._CACHE.clear()
+    payloads = {
+        "aggs": {"results": [{"t": 2, "c": 1.5}, {"t": 1, "c": 1.0}], "resultsCount": 2, "status": "OK"},
+        "snapshot": {"ticker": {"day": {"c": 4.0}, "min": {"c": 4.1}, "prevDay": {"c": 3.0},
+                                "todaysChange": 1.0, "todaysChangePerc": 33.3}},
+    }
+    calls = []
+
+    def fake_get(endpoint, params=None):
+        calls.append(endpoint)
+        return payloads["snapshot" if endpoint.startswith("/snapshot/") else "aggs"]
+
+    c = PolygonClient(api_key="test-key")
+    monkeypatch.setattr(c, "_get", fake_get)
+    yield c, calls
+    polygon_client._CACHE.clear()
+
+
+def test_aggregates_callers_cannot_corrupt_the_cache(client):
+    c, calls = client
+    first = c.get_aggregates("abc", "2025-01-02", "2025-01-03")
+    first["results"].sort(key=lambda b: b["t"])
+    first["results"][0]["c"] = -1.0
+    first["results"].append({"t": 3})
+
+    again = c.get_aggregates("abc", "2025-01-02", "2025-01-03")
+    assert len(calls) == 1  # served from the cache
+    assert again["results"] == [{"t": 2, "c": 1.5}, {"t": 1, "c": 1.0}]
+
+
+def test_snapshot_callers_cannot_corrupt_the_cache(client):
+    c, calls = client
+    c.get_snapshot("abc")["day"]["c"] = 0.0
+    assert c.get_snapshot("abc")["day"] == {"c": 4.0}
+    assert len(calls) == 1